@@ -1,4 +1,5 @@
 import ujson as json
+from typing import Optional, Dict
 
 
 class BinanceChainAPIException(Exception):
@@ -36,16 +37,18 @@ class BinanceChainSigningAuthenticationException(Exception):
 
 
 class BinanceChainRPCException(Exception):
-    def __init__(self, response):
+    def __init__(self, response, error: Optional[Dict] = None):
         self.code = 0
-        try:
-            json_res = json.loads(response.content)
-        except ValueError:
-            self.message = 'Invalid JSON error message from Binance Chain: {}'.format(response.text)
-        else:
-            self.code = json_res['error']['code']
-            self.message = json_res['error']['message']
-        self.status_code = response.status_code
+        if error is None:
+            try:
+                error = json.loads(response.content)['error']
+            except ValueError:
+                self.message = 'Invalid JSON error message from Binance Chain: {}'.format(response.text)
+        if error is not None:
+            self.code = error['code']
+            self.message = error['message']
+        # aiohttp responses expose the status code as `status`
+        self.status_code = getattr(response, 'status_code', None) or getattr(response, 'status', None)
         self.response = response
         self.request = getattr(response, 'request', None)
 
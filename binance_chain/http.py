@@ -106,7 +106,7 @@ class HttpApiClient(BaseApiClient):
         response.
         """
 
-        if not str(response.status_code).startswith('2'):
+        if not 200 <= response.status_code < 300:
             raise BinanceChainAPIException(response, response.status_code)
         try:
             res = response.json()
@@ -760,7 +760,7 @@ class AsyncHttpApiClient(BaseApiClient):
         Raises the appropriate exceptions when necessary; otherwise, returns the
         response.
         """
-        if not str(response.status).startswith('2'):
+        if not 200 <= response.status < 300:
             raise BinanceChainAPIException(response, response.status)
         try:
             res = await response.json()
@@ -1,6 +1,7 @@
 import re
+import struct
 import binascii
-from typing import Optional
+from typing import Optional, List
 
 from btchip.btchip import writeUint32LE, BTChipException
 
@@ -24,16 +25,21 @@ class LedgerApp:
     def __init__(self, dongle, env: Optional[BinanceEnvironment] = None):
         self._dongle = dongle
         self._path = LedgerApp.HD_PATH
+        self._dongle_path = self._parse_hd_path(self._path)
         self._env = env or BinanceEnvironment.get_production_env()
         self._hrp = self._env.hrp
 
-    def _exchange(self, apdu):
-        apdu_data = bytearray(apdu)
+    def _build_apdu(self, ins, p1=0x00, p2=0x00, data=b''):
+        apdu = bytearray(struct.pack('BBBBB', self.BNC_CLA, ins, p1, p2, len(data)))
+        apdu += data
+        return apdu
+
+    def _exchange(self, apdu: bytearray):
         try:
-            response = self._dongle.exchange(apdu_data)
+            response = self._dongle.exchange(apdu)
         except BTChipException as e:
             if e.message.startswith('Invalid status'):
-                raise LedgerRequestException(e.sw, binascii.hexlify(apdu_data))
+                raise LedgerRequestException(e.sw, binascii.hexlify(apdu))
             else:
                 raise e
 
@@ -54,8 +60,7 @@ class LedgerApp:
 
         """
         result = {}
-        apdu = [self.BNC_CLA, self.BNC_INS_GET_VERSION, 0x00, 0x00, 0x00]
-        response = self._exchange(apdu)
+        response = self._exchange(self._build_apdu(self.BNC_INS_GET_VERSION))
 
         result['testMode'] = (response[0] == 0xFF)
         result['version'] = "%d.%d.%d" % (response[1], response[2], response[3])
@@ -76,10 +81,7 @@ class LedgerApp:
             '<public_key>'
 
         """
-        dongle_path = self._parse_hd_path(self._path)
-        apdu = [self.BNC_CLA, self.BNC_INS_PUBLIC_KEY_SECP256K1, 0x00, 0x00, len(dongle_path)]
-        apdu.extend(dongle_path)
-        response = self._exchange(apdu)
+        response = self._exchange(self._build_apdu(self.BNC_INS_PUBLIC_KEY_SECP256K1, data=self._dongle_path))
 
         return response[0: 1 + 64]
 
@@ -94,10 +96,8 @@ class LedgerApp:
 
 
         """
-        dongle_path = self._parse_hrp(self._hrp) + self._parse_hd_path(self._path)
-        apdu = [self.BNC_CLA, self.BNC_INS_SHOW_ADDR_SECP256K1, 0x00, 0x00, len(dongle_path)]
-        apdu.extend(dongle_path)
-        self._exchange(apdu)
+        dongle_path = self._parse_hrp(self._hrp) + self._dongle_path
+        self._exchange(self._build_apdu(self.BNC_INS_SHOW_ADDR_SECP256K1, data=dongle_path))
 
     def get_address(self) -> dict:
         """Gets the address and public key from the Ledger app that is currently open on the device.
@@ -113,19 +113,18 @@ class LedgerApp:
             {'pk': '<public_key>', 'address': '<address>'}
 
         """
-        dongle_path = self._parse_hrp(self._hrp) + self._parse_hd_path(self._path)
-        apdu = [self.BNC_CLA, self.BNC_INS_GET_ADDR_SECP256K1, 0x00, 0x00, len(dongle_path)]
-        apdu.extend(dongle_path)
-        response = self._exchange(apdu)
+        dongle_path = self._parse_hrp(self._hrp) + self._dongle_path
+        response = self._exchange(self._build_apdu(self.BNC_INS_GET_ADDR_SECP256K1, data=dongle_path))
         return {
             'pk': response[0: 1 + 32],
             'address': response[1 + 32:].decode()
         }
 
-    def _get_sign_chunks(self, msg: bytes):
-        chunks = [self._parse_hd_path(self._path)]
-        chunks += [msg[i:i + self.CHUNK_SIZE] for i in range(0, len(msg), self.CHUNK_SIZE)]
-        return chunks
+    def _iter_sign_chunks(self, msg: bytes):
+        yield self._dongle_path
+        msg_view = memoryview(msg)
+        for i in range(0, len(msg_view), self.CHUNK_SIZE):
+            yield msg_view[i:i + self.CHUNK_SIZE]
 
     def sign(self, msg: bytes) -> str:
         """Sends a transaction sign doc to the Ledger app to be signed.
@@ -141,31 +140,55 @@ class LedgerApp:
             '<signed message hash>'
 
         """
-        chunks = self._get_sign_chunks(msg)
+        return self._sign_chunks(list(self._iter_sign_chunks(msg)))
+
+    def sign_many(self, msgs: List[bytes]) -> List[str]:
+        """Sends a batch of transaction sign docs to the Ledger app to be signed.
+
+        The sign chunks for every message are built before the first exchange, the messages are then signed one
+        after another with the same APDU exchanges as sign and each needs to be confirmed on the device.
+
+        .. code:: python
+
+            signatures = client.sign_many([msg_1, msg_2])
+
+        :return: list of str
+
+        .. code:: python
+
+            ['<signed message hash>', '<signed message hash>']
+
+        """
+        msg_chunks = [list(self._iter_sign_chunks(msg)) for msg in msgs]
+        return [self._sign_chunks(chunks) for chunks in msg_chunks]
+
+    def _sign_chunks(self, chunks) -> str:
         response = ''
         for idx, chunk in enumerate(chunks):
-            apdu = [self.BNC_CLA, self.BNC_INS_SIGN_SECP256K1, idx + 1, len(chunks), len(chunk)]
-            apdu.extend(chunk)
-            response = self._exchange(apdu)
+            response = self._exchange(
+                self._build_apdu(self.BNC_INS_SIGN_SECP256K1, idx + 1, len(chunks), chunk)
+            )
 
-        if response[0] != 0x30:
+        # decode DER format - 0x30 <len> 0x02 <r_len> <r> 0x02 <s_len> <s>
+        header, seq_len, _, r_len = struct.unpack_from('BBBB', response)
+        if header != 0x30:
             raise Exception("Ledger assertion failed: Expected a signature header of 0x30")
 
-        # decode DER format
+        s_len, = struct.unpack_from('B', response, 5 + r_len)
+        sig_end = 2 + seq_len
         r_offset = 4
-        r_len = response[3]
-        s_len = response[4 + r_len + 1]
-        s_offset = len(response) - s_len
+        s_offset = sig_end - s_len
 
+        # strip the leading zero padding from 33 byte integers
         if r_len == 33:
             r_offset += 1
             r_len -= 1
 
-        if s_len == 3:
+        if s_len == 33:
             s_offset += 1
 
         sig_r = response[r_offset: r_offset + r_len]
-        sig_s = response[s_offset:]
+        sig_s = response[s_offset: sig_end]
 
         return sig_r + sig_s
 
@@ -17,6 +17,7 @@ class LedgerRequestException(Exception):
         self._response_msg = LEDGER_RESPONSE_CODES.get(response_code, 'Unknown')
 
         self._request = request
+        self._str = f'LedgerRequestException(code={response_code}): {self._response_msg} - request {request}'
 
     def __str__(self):  # pragma: no cover
-        return f'LedgerRequestException(code={self._response_code}): {self._response_msg} - request {self._request}'
+        return self._str
@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import Optional, List
 
 from binance_chain.environment import BinanceEnvironment
 from binance_chain.wallet import BaseWallet
 from binance_chain.ledger.client import LedgerApp
+from binance_chain.utils.segwit_addr import decode_address
 
 
 class LedgerWallet(BaseWallet):
@@ -13,6 +14,10 @@ class LedgerWallet(BaseWallet):
         pk_address = self._app.get_address()
         self._public_key = pk_address['pk']
         self._address = pk_address['address']
+        self._address_decoded = decode_address(self._address)
 
     def sign_message(self, msg_bytes):
         return self._app.sign(msg_bytes)
+
+    def sign_messages_batch(self, msgs: List[bytes]):
+        return self._app.sign_many(msgs)
@@ -3,6 +3,7 @@ import binascii
 from typing import List, Dict, Union, Optional, NamedTuple
 from decimal import Decimal
 from collections import OrderedDict
+from functools import lru_cache
 
 from binance_chain.wallet import BaseWallet
 from binance_chain.constants import TimeInForce, OrderSide, OrderType, VoteOption
@@ -11,10 +12,14 @@ from binance_chain.protobuf.dex_pb2 import (
 )
 from binance_chain.utils.encode_utils import encode_number, varint_encode
 from binance_chain.utils.segwit_addr import decode_address
+from binance_chain.utils import json_utils
 
 # An identifier for tools triggering broadcast transactions, set to zero if unwilling to disclose.
 BROADCAST_SOURCE = 0
 
+# decoded counterparty addresses, repeated transfers to the same address skip the bech32 decode
+_decode_address = lru_cache(maxsize=4096)(decode_address)
+
 
 class Transfer(NamedTuple):
     amount: Union[int, float, Decimal]
@@ -26,6 +31,8 @@ class Msg:
     AMINO_MESSAGE_TYPE = ""
     INCLUDE_AMINO_LENGTH_PREFIX = False
 
+    _sign_json: Optional[bytes] = None
+
     def __init__(self, wallet: BaseWallet, memo: str = ''):
         self._wallet = wallet
         self._memo = memo
@@ -36,6 +43,14 @@ class Msg:
     def to_sign_dict(self) -> Dict:
         return {}
 
+    def to_sign_json(self) -> bytes:
+        """Serialised sign dict for the signing service, messages are immutable so this is only encoded once
+
+        """
+        if self._sign_json is None:
+            self._sign_json = json_utils.dumps_decimal(self.to_sign_dict())
+        return self._sign_json
+
     def to_protobuf(self):
         pass
 
@@ -83,7 +98,6 @@ class Signature:
         self._msg = msg
         self._chain_id = msg.wallet.chain_id
         self._data = data
-        self._source = BROADCAST_SOURCE
 
     def to_json(self):
         return json.dumps(OrderedDict([
@@ -93,7 +107,7 @@ class Signature:
             ('memo', self._msg.memo),
             ('msgs', [self._msg.to_dict()]),
             ('sequence', str(self._msg.wallet.sequence)),
-            ('source', str(self._source))
+            ('source', str(BROADCAST_SOURCE))
         ]), ensure_ascii=False)
 
     def to_bytes_json(self):
@@ -384,7 +398,6 @@ class StdTxMsg(Msg):
         self._msg = msg
         self._signature = SignatureMsg(msg)
         self._data = data
-        self._source = BROADCAST_SOURCE
 
     def to_protobuf(self) -> StdTx:
         stdtx = StdTx()
@@ -392,7 +405,7 @@ class StdTxMsg(Msg):
         stdtx.signatures.extend([self._signature.to_amino()])
         stdtx.data = self._data.encode()
         stdtx.memo = self._msg.memo
-        stdtx.source = self._source
+        stdtx.source = BROADCAST_SOURCE
         return stdtx
 
 
@@ -435,6 +448,7 @@ class TransferMsg(Msg):
         self._amount = amount
         self._amount_amino = encode_number(amount)
         self._from_address = wallet.address if wallet else None
+        self._from_address_decoded = wallet.address_decoded if wallet else None
         self._to_address = to_address
 
     def to_dict(self):
@@ -471,20 +485,11 @@ class TransferMsg(Msg):
         }
 
     def to_protobuf(self) -> Send:
-        token = Token()
-        token.denom = self._symbol
-        token.amount = self._amount_amino
-        input_addr = Input()
-        input_addr.address = decode_address(self._from_address)
-        input_addr.coins.extend([token])
-        output_addr = Output()
-        output_addr.address = decode_address(self._to_address)
-        output_addr.coins.extend([token])
-
-        msg = Send()
-        msg.inputs.extend([input_addr])
-        msg.outputs.extend([output_addr])
-        return msg
+        token = Token(denom=self._symbol, amount=self._amount_amino)
+        return Send(
+            inputs=[Input(address=self._from_address_decoded, coins=[token])],
+            outputs=[Output(address=_decode_address(self._to_address), coins=[token])]
+        )
 
 
 class MultiTransferMsg(Msg):
@@ -502,6 +507,7 @@ class MultiTransferMsg(Msg):
         self._transfers = transfers
         self._transfers.sort(key=lambda x: x.symbol)
         self._from_address = wallet.address if wallet else None
+        self._from_address_decoded = wallet.address_decoded if wallet else None
         self._to_address = to_address
 
     def to_dict(self):
@@ -550,8 +556,8 @@ class MultiTransferMsg(Msg):
             token.amount = encode_number(transfer.amount)
             input_addr.coins.extend([token])
             output_addr.coins.extend([token])
-        input_addr.address = decode_address(self._from_address)
-        output_addr.address = decode_address(self._to_address)
+        input_addr.address = self._from_address_decoded
+        output_addr.address = _decode_address(self._to_address)
 
         msg = Send()
         msg.inputs.extend([input_addr])
@@ -0,0 +1,37 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class RpcResponseCache:
+    """In-memory LRU cache for immutable RPC responses, such as blocks and transactions at a fixed height
+
+    Any object providing the same `get` and `set` methods may be passed to the RPC clients instead,
+    for example to persist responses on disk.
+
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self._maxsize = maxsize
+        self._cache: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._cache[key]
+        except KeyError:
+            return default
+        self._cache.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self._maxsize <= 0:
+            return
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
@@ -1,27 +1,198 @@
 import asyncio
+import base64
 import itertools
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Optional, Dict, List, Tuple, Union, Iterable, Iterator, AsyncIterator
 
 import requests
 import aiohttp
 import ujson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from binance_chain.exceptions import BinanceChainRPCException, BinanceChainRequestException
 from binance_chain.constants import RpcBroadcastRequestType
-from binance_chain.messages import Msg
-from binance_chain.node_rpc.request import RpcRequest
+from binance_chain.messages import Msg, StdTxMsg
+from binance_chain.node_rpc.request import get_request_template, format_request, build_params
+from binance_chain.node_rpc.cache import RpcResponseCache
+from binance_chain.utils import json_utils
 
 
 requests.models.json = ujson
 
+# block results and consensus dumps are large and compress well, requests and aiohttp both decompress transparently
+RPC_HEADERS = MappingProxyType({
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate',
+    'Content-Type': 'application/json',
+    'User-Agent': 'python-binance-chain',
+})
+
+
+# (method name, RPC path, docstring) of the endpoints taking no params
+_PARAMLESS_METHODS = (
+    (
+        'get_abci_info', 'abci_info',
+        """Get some info about the application.
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#abciinfo
+
+        """
+    ),
+    (
+        'get_consensus_state', 'consensus_state',
+        """ConsensusState returns a concise summary of the consensus state. UNSTABLE
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#consensusstate
+
+        """
+    ),
+    (
+        'dump_consensus_state', 'dump_consensus_state',
+        """DumpConsensusState dumps consensus state. UNSTABLE
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#dumpconsensusstate
+
+        """
+    ),
+    (
+        'get_genesis', 'genesis',
+        """Get genesis file.
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#genesis
+
+        """
+    ),
+    (
+        'get_net_info', 'net_info',
+        """Get network info.
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#netinfo
+
+        """
+    ),
+    (
+        'get_num_unconfirmed_txs', 'num_unconfirmed_txs',
+        """Get number of unconfirmed transactions.
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#numunconfirmedtxs
+
+        """
+    ),
+    (
+        'get_status', 'status',
+        """Get Tendermint status including node info, pubkey, latest block hash, app hash, block height and time.
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#status
+
+        """
+    ),
+    (
+        'get_health', 'health',
+        """Get node health. Returns empty result (200 OK) on success, no response - in case of an error.
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#health
+
+        """
+    ),
+    (
+        'get_unconfirmed_txs', 'unconfirmed_txs',
+        """Get unconfirmed transactions (maximum ?limit entries) including their number.
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#unconfirmedtxs
+
+        """
+    ),
+    (
+        'get_validators', 'validators',
+        """Get the validator set at the given block height. If no height is provided, it will fetch the
+        current validator set.
+
+        https://binance-chain.github.io/api-reference/node-rpc.html#validators
+
+        """
+    ),
+)
+
+
+# responses that never change for a node, these are kept in the response cache
+_IMMUTABLE_PATHS = frozenset(['genesis'])
+
+
+def _make_paramless_method(name: str, path: str, doc: str):
+    if path in _IMMUTABLE_PATHS:
+        def method(self):
+            return self._request_cached(path, {})
+    else:
+        def method(self):
+            return self._request(path)
+    method.__name__ = method.__qualname__ = name
+    method.__doc__ = doc
+    return method
+
+
+def _make_async_paramless_method(name: str, path: str, doc: str):
+    if path in _IMMUTABLE_PATHS:
+        async def method(self):
+            return await self._request_cached(path, {})
+    else:
+        async def method(self):
+            return await self._request(path)
+    method.__name__ = method.__qualname__ = name
+    method.__doc__ = doc
+    return method
+
 
 class BaseHttpRpcClient:
 
     id_generator = itertools.count(1)
 
-    def __init__(self, endpoint_url, requests_params: Optional[Dict] = None):
+    DEFAULT_MAX_CONNECTIONS = 32
+
+    # retries back off 0.5s, 1s, 2s between attempts
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_STATUS_CODES = (502, 503, 504)
+
+    CONNECT_TIMEOUT = 3
+    DEFAULT_TIMEOUT = 10
+
+    # max number of calls sent in a single batch request by helpers like get_blocks
+    BATCH_SIZE = 50
+
+    # RPC path and client method used for each broadcast request type
+    BROADCAST_PATHS = {
+        RpcBroadcastRequestType.ASYNC: 'broadcast_tx_async',
+        RpcBroadcastRequestType.COMMIT: 'broadcast_tx_commit',
+        RpcBroadcastRequestType.SYNC: 'broadcast_tx_sync',
+    }
+    BROADCAST_FUNCS = {
+        RpcBroadcastRequestType.ASYNC: '_broadcast_tx_async',
+        RpcBroadcastRequestType.COMMIT: '_broadcast_tx_commit',
+        RpcBroadcastRequestType.SYNC: '_broadcast_tx_sync',
+    }
+
+    def __init__(self, endpoint_url, requests_params: Optional[Dict] = None, cache: Optional[RpcResponseCache] = None,
+                 timeout: Optional[float] = None, max_connections: Optional[int] = None):
+        """Node RPC HTTP client constructor
+
+        :param endpoint_url: URL of the node RPC endpoint
+        :param requests_params: (optional) Dictionary of requests params to use for all calls
+        :param cache: (optional) cache for immutable responses e.g. blocks at a given height, defaults to an
+            in-memory LRU cache. Any object with matching `get` and `set` methods may be used.
+        :param timeout: (optional) read timeout in seconds for each request, defaults to 10. Connecting to the node
+            times out after 3 seconds.
+        :param max_connections: (optional) size of the connection pool to the node, defaults to 32 for the sync
+            client and 100 for the async client
+
+        """
         self._endpoint_url = endpoint_url
         self._requests_params = requests_params
+        self._cache = cache if cache is not None else RpcResponseCache()
+        self._timeout = timeout or self.DEFAULT_TIMEOUT
+        self._max_connections = max_connections or self.DEFAULT_MAX_CONNECTIONS
+        self._path_urls: Dict[str, str] = {}
 
         self.session = self._init_session()
 
@@ -29,85 +200,289 @@ class BaseHttpRpcClient:
 
         session = requests.session()
         session.headers.update(self._get_headers())
+        session.headers['Connection'] = 'keep-alive'
+
+        # keep connections to the node alive and pooled across requests, retrying transient failures
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET', 'POST']),
+            raise_on_status=False
+        )
+        adapter = self._get_http_adapter(retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        # broadcasts are not idempotent, never retry them so a transaction isn't sent twice
+        session.mount(f"{self._endpoint_url}/broadcast_tx_", self._get_http_adapter(0))
         return session
 
-    def _get_rpc_request(self, path, **kwargs) -> str:
+    def _get_http_adapter(self, max_retries: Union[Retry, int]) -> HTTPAdapter:
+        return HTTPAdapter(
+            pool_connections=self._max_connections, pool_maxsize=self._max_connections, pool_block=False,
+            max_retries=max_retries
+        )
+
+    @staticmethod
+    def _format_rpc_request(path, req_id: int, params: Optional[Dict] = None) -> bytes:
+
+        # requests are formatted from cached templates instead of being re-serialised
+        if not params:
+            return get_request_template(path) % req_id
+
+        return format_request(path, req_id, params)
+
+    def _get_rpc_request(self, path, params: Optional[Dict] = None) -> bytes:
+        return self._format_rpc_request(path, next(self.id_generator), params)
+
+    def _get_rpc_batch_request(self, calls: List[Tuple[str, Optional[Dict]]]) -> Tuple[List[int], bytes]:
+
+        ids = [next(self.id_generator) for _ in calls]
+        rpc_requests = [self._format_rpc_request(method, req_id, params) for req_id, (method, params) in zip(ids, calls)]
+
+        return ids, b'[%s]' % b','.join(rpc_requests)
+
+    def _get_path_url(self, path: str) -> str:
+        try:
+            return self._path_urls[path]
+        except KeyError:
+            return self._path_urls.setdefault(path, f"{self._endpoint_url}/{path}")
+
+    @staticmethod
+    def _get_cache_key(path, data: Dict):
+        return (path, ) + tuple(sorted(data.items()))
+
+    @staticmethod
+    def _handle_batch_results(response, res, ids: List[int]) -> List:
+        """Internal helper for matching batch responses to their requests by id.
+        Raises the appropriate exceptions when necessary; otherwise, returns the
+        results in request order.
+        """
+
+        # a single error object is returned if the batch itself was rejected
+        if isinstance(res, dict):
+            if res.get('error'):
+                raise BinanceChainRPCException(response, res['error'])
+            raise BinanceChainRequestException('Invalid Batch Response: %s' % res)
+
+        res_by_id = {r.get('id'): r for r in res}
+
+        results = []
+        for req_id in ids:
+            try:
+                rpc_res = res_by_id[req_id]
+            except KeyError:
+                raise BinanceChainRequestException(f'Missing Batch Response for request id {req_id}')
+            if rpc_res.get('error'):
+                raise BinanceChainRPCException(response, rpc_res['error'])
+            results.append(rpc_res.get('result'))
+        return results
+
+    def _get_cached_blocks(self, heights: List[int]) -> Tuple[Dict[int, Dict], List[int]]:
+        """Split heights into blocks already in the cache and unique heights that still need to be fetched
+
+        """
+        blocks = {}
+        missing = []
+        for height in dict.fromkeys(heights):
+            res = self._cache.get(self._get_cache_key('block', build_params(('height', height))))
+            if res is None:
+                missing.append(height)
+            else:
+                blocks[height] = res
+        return blocks, missing
+
+    def _get_broadcast_calls(self, msgs: List[Msg], request_type: RpcBroadcastRequestType) -> List[Tuple[str, Dict]]:
+        """Sign each message in turn, incrementing the wallet sequence after each so they can be sent together
+
+        """
+        method = self.BROADCAST_PATHS[request_type]
+
+        calls = []
+        for i, msg in enumerate(msgs):
+            try:
+                msg.wallet.initialise_wallet()
+                # JSON-RPC params take the tx base64 encoded rather than the 0x hex used by the URI endpoints
+                calls.append((method, {'tx': base64.b64encode(StdTxMsg(msg).to_amino()).decode()}))
+            except Exception:
+                # nothing has been sent, undo the increments for the messages already signed
+                self._reset_broadcast_sequences(msgs[:i])
+                raise
+            msg.wallet.increment_account_sequence()
+        return calls
+
+    @staticmethod
+    def _reset_broadcast_sequences(msgs: List[Msg]):
+        for msg in msgs:
+            msg.wallet.decrement_account_sequence()
+
+    @staticmethod
+    def _reload_broadcast_sequences(msgs: List[Msg]):
+        # without a response it's unknown which transactions the node applied, take the sequences from the chain
+        for wallet in dict.fromkeys(msg.wallet for msg in msgs):
+            wallet.reload_account_sequence()
+
+    @staticmethod
+    def _broadcast_rejected(result: Optional[Dict]) -> bool:
+        # a transaction failing CheckTx doesn't use its sequence, the code is nested under check_tx for COMMIT
+        if not result:
+            return False
+        return bool((result.get('check_tx') or result).get('code'))
 
-        rpc_request = RpcRequest(path, next(self.id_generator), kwargs.get('data', None))
+    def _handle_broadcast_results(self, response, res, ids: List[int], msgs: List[Msg]) -> List:
+        """Internal helper for broadcast batch responses, resetting the wallet sequences from the first transaction
+        the node rejected so that it and the ones after it can be signed again, then returning the results.
+
+        """
+        if isinstance(res, list):
+            res_by_id = {r.get('id'): r for r in res}
+            for i, req_id in enumerate(ids):
+                rpc_res = res_by_id.get(req_id)
+                if rpc_res is None or rpc_res.get('error') or self._broadcast_rejected(rpc_res.get('result')):
+                    self._reset_broadcast_sequences(msgs[i:])
+                    break
+        else:
+            # the batch itself was rejected so none of the transactions were applied
+            self._reset_broadcast_sequences(msgs)
+        return self._handle_batch_results(response, res, ids)
 
-        return str(rpc_request)
+    def _get_block_batches(self, heights: List[int]) -> List[List[Tuple[str, Dict]]]:
+        calls = [('block', build_params(('height', height))) for height in heights]
+        return [calls[i:i + self.BATCH_SIZE] for i in range(0, len(calls), self.BATCH_SIZE)]
+
+    def _cache_blocks(self, blocks: Dict[int, Dict], heights: List[int], results: Iterable[Dict]):
+        for height, res in zip(heights, results):
+            blocks[height] = res
+            self._cache.set(self._get_cache_key('block', build_params(('height', height))), res)
 
     def _get_headers(self):
-        return {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json',
-            'User-Agent': 'python-binance-chain',
-        }
+        # set once on the session which sends them with every request
+        return RPC_HEADERS
 
-    def request_kwargs(self, method, **kwargs):
+    def _get_request_kwargs(self, timeout: Optional[float] = None) -> Dict:
 
-        # set default requests timeout
-        kwargs['timeout'] = 10
+        # bound connecting separately so a dead node fails fast
+        kwargs = {
+            'timeout': (self.CONNECT_TIMEOUT, timeout or self._timeout)
+        }
 
         # add our global requests params
         if self._requests_params:
             kwargs.update(self._requests_params)
 
-        kwargs['data'] = kwargs.get('data', {})
-        kwargs['headers'] = kwargs.get('headers', {})
+        return kwargs
 
-        if kwargs['data'] and method == 'get':
-            kwargs['params'] = kwargs['data']
-            del(kwargs['data'])
 
-        if method == 'post':
-            kwargs['headers']['content-type'] = 'text/plain'
+class HttpRpcClient(BaseHttpRpcClient):
 
-        return kwargs
+    _broadcast_session: Optional[requests.Session] = None
 
+    def close(self):
+        """Close the underlying session and any pooled connections
 
-class HttpRpcClient(BaseHttpRpcClient):
+        """
+        self.session.close()
+        if self._broadcast_session is not None:
+            self._broadcast_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _post(self, rpc_request: bytes, timeout: Optional[float] = None):
+        return self.session.post(
+            self._endpoint_url, data=rpc_request, **self._get_request_kwargs(timeout)
+        )
+
+    def _post_broadcast(self, rpc_request: bytes):
+        # broadcast batches go to the endpoint root like other requests, post them on a session without retries so
+        # a batch the node accepted is never sent again
+        if self._broadcast_session is None:
+            session = requests.session()
+            session.headers.update(self.session.headers)
+            adapter = self._get_http_adapter(0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._broadcast_session = session
+
+        return self._broadcast_session.post(self._endpoint_url, data=rpc_request, **self._get_request_kwargs())
 
     def _request(self, path, **kwargs):
 
-        rpc_request = self._get_rpc_request(path, **kwargs)
+        rpc_request = self._get_rpc_request(path, kwargs.get('data'))
 
-        response = self.session.post(self._endpoint_url, data=rpc_request.encode(), headers=self._get_headers())
+        response = self._post(rpc_request, kwargs.get('timeout'))
 
-        return self._handle_response(response)
+        return self._handle_response(response, kwargs.get('lazy', False))
+
+    def _request_cached(self, path, data: Dict):
+        cache_key = self._get_cache_key(path, data)
+        res = self._cache.get(cache_key)
+        if res is None:
+            res = self._request(path, data=data)
+            self._cache.set(cache_key, res)
+        return res
+
+    def batch_request(self, calls: List[Tuple[str, Optional[Dict]]]) -> List:
+        """Send multiple RPC calls in a single JSON-RPC batch request
+
+        Results are returned in the same order as the calls.
+
+        .. code:: python
+
+            blocks = client.batch_request([
+                ('block', {'height': '1'}),
+                ('block', {'height': '2'}),
+            ])
+
+        :param calls: list of (method, params) tuples, params may be None
+        :return: list of results
+
+        """
+        ids, rpc_request = self._get_rpc_batch_request(calls)
+
+        response = self._post(rpc_request)
+
+        try:
+            res = json_utils.loads(response.content)
+        except ValueError:
+            raise BinanceChainRequestException('Invalid Response: %s' % response.text)
+        return self._handle_batch_results(response, res, ids)
 
     def _request_session(self, path, params=None):
 
-        kwargs = {
-            'params': params,
-            'headers': self._get_headers()
-        }
+        kwargs = self._get_request_kwargs()
+        kwargs['params'] = params
 
-        response = self.session.get(f"{self._endpoint_url}/{path}", **kwargs)
+        response = self.session.get(self._get_path_url(path), **kwargs)
 
         return self._handle_session_response(response)
 
     @staticmethod
-    def _handle_response(response):
+    def _handle_response(response, lazy: bool = False):
         """Internal helper for handling API responses from the server.
         Raises the appropriate exceptions when necessary; otherwise, returns the
         response.
         """
 
         try:
-            res = response.json()
-
-            if 'error' in res and res['error']:
-                raise BinanceChainRPCException(response)
-
-            # by default return full response
-            # if it's a normal response we have a data attribute, return that
-            if 'result' in res:
-                res = res['result']
-            return res
+            res = json_utils.loads_lazy(response.content) if lazy else json_utils.loads(response.content)
         except ValueError:
             raise BinanceChainRequestException('Invalid Response: %s' % response.text)
 
+        # pass the parsed error through so the exception doesn't decode the body again
+        if 'error' in res and res['error']:
+            raise BinanceChainRPCException(response, res['error'])
+
+        # by default return full response
+        # if it's a normal response we have a data attribute, return that
+        if 'result' in res:
+            res = res['result']
+        return res
+
     @staticmethod
     def _handle_session_response(response):
         """Internal helper for handling API responses from the server.
@@ -115,10 +490,10 @@ class HttpRpcClient(BaseHttpRpcClient):
         response.
         """
 
-        if not str(response.status_code).startswith('2'):
+        if not 200 <= response.status_code < 300:
             raise BinanceChainRPCException(response)
         try:
-            res = response.json()
+            res = json_utils.loads(response.content)
 
             if 'code' in res and res['code'] != "200000":
                 raise BinanceChainRPCException(response)
@@ -143,87 +518,6 @@ class HttpRpcClient(BaseHttpRpcClient):
         res = self._request(self._endpoint_url, method="get")
         return res.content
 
-    def get_abci_info(self):
-        """Get some info about the application.
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#abciinfo
-
-        """
-        return self._request('abci_info')
-
-    def get_consensus_state(self):
-        """ConsensusState returns a concise summary of the consensus state. UNSTABLE
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#consensusstate
-
-        """
-        return self._request('consensus_state')
-
-    def dump_consensus_state(self):
-        """DumpConsensusState dumps consensus state. UNSTABLE
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#dumpconsensusstate
-
-        """
-        return self._request('dump_consensus_state')
-
-    def get_genesis(self):
-        """Get genesis file.
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#genesis
-
-        """
-        return self._request('genesis')
-
-    def get_net_info(self):
-        """Get network info.
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#netinfo
-
-        """
-        return self._request('net_info')
-
-    def get_num_unconfirmed_txs(self):
-        """Get number of unconfirmed transactions.
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#numunconfirmedtxs
-
-        """
-        return self._request('num_unconfirmed_txs')
-
-    def get_status(self):
-        """Get Tendermint status including node info, pubkey, latest block hash, app hash, block height and time.
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#status
-
-        """
-        return self._request('status')
-
-    def get_health(self):
-        """Get node health. Returns empty result (200 OK) on success, no response - in case of an error.
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#health
-
-        """
-        return self._request('health')
-
-    def get_unconfirmed_txs(self):
-        """Get unconfirmed transactions (maximum ?limit entries) including their number.
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#unconfirmedtxs
-
-        """
-        return self._request('unconfirmed_txs')
-
-    def get_validators(self):
-        """Get the validator set at the given block height. If no height is provided, it will fetch the
-        current validator set.
-
-        https://binance-chain.github.io/api-reference/node-rpc.html#validators
-
-        """
-        return self._request('validators')
-
     def abci_query(self, data: str, path: Optional[str] = None,
                    prove: Optional[bool] = None, height: Optional[int] = None):
         """Query the application for some information.
@@ -237,34 +531,63 @@ class HttpRpcClient(BaseHttpRpcClient):
 
         """
 
-        data = {
-            'data': data
-        }
-        if path:
-            data['path'] = path
-        if prove:
-            data['prove'] = str(prove)
-        if height:
-            data['height'] = str(height)
+        data = build_params(('data', data), ('path', path), ('prove', prove), ('height', height))
 
         return self._request('abci_query', data=data)
 
-    def get_block(self, height: Optional[int] = None):
+    def get_block(self, height: Optional[int] = None, lazy: bool = False):
         """Get block at a given height. If no height is provided, it will fetch the latest block.
 
         https://binance-chain.github.io/api-reference/node-rpc.html#block
 
         height	int64
 
+        If lazy is set and pysimdjson is installed the response is parsed on demand and returned as read-only
+        proxies, only the fields accessed are converted. Lazy responses are not cached.
+
+        .. code:: python
+
+            height = client.get_block(10000, lazy=True)['block']['header']['height']
+
         """
 
-        data = {
-            'height': str(height) if height else None
-        }
+        data = build_params(('height', height))
 
+        if lazy:
+            return self._request('block', data=data, lazy=True)
+        if height:
+            return self._request_cached('block', data)
         return self._request('block', data=data)
 
-    def get_block_result(self, height: int):
+    def get_blocks(self, heights: Iterable[int], concurrency: int = 8) -> List:
+        """Get blocks at the given heights, returned in the same order as the heights
+
+        Blocks are fetched in batch requests of up to 50 blocks, with batches sent concurrently.
+
+        .. code:: python
+
+            blocks = client.get_blocks(range(10000, 10200))
+
+        :param heights: block heights to fetch
+        :param concurrency: max number of batch requests in flight at once
+        :return: list of blocks
+
+        """
+        heights = list(heights)
+        blocks, missing = self._get_cached_blocks(heights)
+
+        batches = self._get_block_batches(missing)
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(self.batch_request, batches))
+        else:
+            results = [self.batch_request(batch) for batch in batches]
+
+        self._cache_blocks(blocks, missing, itertools.chain.from_iterable(results))
+
+        return [blocks[height] for height in heights]
+
+    def get_block_result(self, height: int, lazy: bool = False):
         """BlockResults gets ABCIResults at a given height. If no height is provided, it will fetch results for the
         latest block.
 
@@ -272,12 +595,16 @@ class HttpRpcClient(BaseHttpRpcClient):
 
         height	int64
 
+        See get_block for the lazy param.
+
         """
 
-        data = {
-            'height': str(height)
-        }
+        data = build_params(('height', height))
 
+        if lazy:
+            return self._request('block_result', data=data, lazy=True)
+        if height:
+            return self._request_cached('block_result', data)
         return self._request('block_result', data=data)
 
     def get_block_commit(self, height: int):
@@ -289,10 +616,10 @@ class HttpRpcClient(BaseHttpRpcClient):
 
         """
 
-        data = {
-            'height': str(height)
-        }
+        data = build_params(('height', height))
 
+        if height:
+            return self._request_cached('commit', data)
         return self._request('commit', data=data)
 
     def get_blockchain_info(self, min_height: int, max_height: int):
@@ -306,12 +633,10 @@ class HttpRpcClient(BaseHttpRpcClient):
 
         """
 
-        assert max_height > min_height
+        if max_height <= min_height:
+            raise BinanceChainRequestException(f'max_height ({max_height}) must be > min_height ({min_height})')
 
-        data = {
-            'minHeight': str(min_height),
-            'maxHeight': str(max_height)
-        }
+        data = build_params(('minHeight', min_height), ('maxHeight', max_height))
 
         return self._request('blockchain', data=data)
 
@@ -337,16 +662,35 @@ class HttpRpcClient(BaseHttpRpcClient):
             'tx': '0x' + data
         }
 
-        if request_type == RpcBroadcastRequestType.ASYNC:
-            res = self._broadcast_tx_async(tx_data)
-        elif request_type == RpcBroadcastRequestType.COMMIT:
-            res = self._broadcast_tx_commit(tx_data)
-        else:
-            res = self._broadcast_tx_sync(tx_data)
+        res = getattr(self, self.BROADCAST_FUNCS[request_type])(tx_data)
 
         msg.wallet.increment_account_sequence()
         return res
 
+    def broadcast_msgs(self, msgs: List[Msg], request_type: RpcBroadcastRequestType = RpcBroadcastRequestType.SYNC):
+        """Broadcast multiple transactions in a single JSON-RPC batch request
+
+        Messages are signed in order with consecutive sequence numbers. If the node rejects a transaction the wallet
+        sequences are reset from that message on, if no response is received they are reloaded from the chain.
+
+        .. code:: python
+
+            res = client.broadcast_msgs([limit_order_msg, cancel_order_msg])
+
+        :param msgs: list of message objects to send
+        :param request_type: type of request to make, see broadcast_msg
+        :return: list of results in the same order as the messages
+        """
+
+        ids, rpc_request = self._get_rpc_batch_request(self._get_broadcast_calls(msgs, request_type))
+        try:
+            response = self._post_broadcast(rpc_request)
+            res = json_utils.loads(response.content)
+        except Exception:
+            self._reload_broadcast_sequences(msgs)
+            raise
+        return self._handle_broadcast_results(response, res, ids, msgs)
+
     def _broadcast_tx_async(self, tx_data: Dict):
         """Returns right away, with no response
 
@@ -380,10 +724,10 @@ class HttpRpcClient(BaseHttpRpcClient):
         height: int
 
         """
-        data = {
-            'height': str(height) if height else None
-        }
+        data = build_params(('height', height))
 
+        if height:
+            return self._request_cached('consensus_params', data)
         return self._request('consensus_params', data=data)
 
     def get_tx(self, tx_hash: str, prove: Optional[bool] = None):
@@ -397,12 +741,10 @@ class HttpRpcClient(BaseHttpRpcClient):
 
         """
 
-        data = {
-            'hash': tx_hash
-        }
-        if prove:
-            data['prove'] = str(prove)
+        data = build_params(('hash', tx_hash), ('prove', prove))
 
+        if not prove:
+            return self._request_cached('tx', data)
         return self._request('tx', data=data)
 
     def tx_search(self, query: str, prove: Optional[bool] = None,
@@ -419,85 +761,216 @@ class HttpRpcClient(BaseHttpRpcClient):
 
         """
 
-        data = {
-            'query': query
-        }
-        if prove:
-            data['prove'] = str(prove)
-        if page:
-            data['page'] = str(page)
-        if limit:
-            data['limit'] = str(limit)
+        data = build_params(('query', query), ('prove', prove), ('page', page), ('limit', limit))
 
         return self._request('tx_search', data=data)
 
+    def iter_txs(self, query: str, per_page: int = 100, prove: Optional[bool] = None) -> Iterator[Dict]:
+        """Iterate over all transactions matching a query, fetching pages from `tx_search` as needed
+
+        Only a single page of results is held in memory at a time.
+
+        .. code:: python
+
+            for tx in client.iter_txs("tx.height=1000"):
+                print(tx['hash'])
+
+        :param query: tx_search query
+        :param per_page: number of transactions to fetch per request (max: 100)
+        :param prove: Include proofs of the transactions inclusion in the block
+        :return: generator of transaction results
+
+        """
+        page = 1
+        while True:
+            txs = self.tx_search(query, prove=prove, page=page, limit=per_page).get('txs') or []
+            yield from txs
+            if len(txs) < per_page:
+                break
+            page += 1
+
+
+for _name, _path, _doc in _PARAMLESS_METHODS:
+    setattr(HttpRpcClient, _name, _make_paramless_method(_name, _path, _doc))
+
 
 class AsyncHttpRpcClient(BaseHttpRpcClient):
 
-    DEFAULT_TIMEOUT = 10
+    DEFAULT_MAX_CONNECTIONS = 100
+    KEEPALIVE_TIMEOUT = 60
+    DNS_CACHE_TTL = 300
+
+    def __init__(self, endpoint_url, requests_params: Optional[Dict] = None, cache: Optional[RpcResponseCache] = None,
+                 timeout: Optional[float] = None, max_connections: Optional[int] = None,
+                 connector: Optional[aiohttp.BaseConnector] = None):
+        """Node RPC HTTP async client constructor, see HttpRpcClient for the other params
+
+        :param connector: (optional) aiohttp connector to share with other clients, it is not closed with this client
+
+        """
+        self._connector = connector
+        super().__init__(endpoint_url, requests_params, cache=cache, timeout=timeout, max_connections=max_connections)
 
     @classmethod
-    async def create(cls, endpoint_url):
+    async def create(cls, endpoint_url, requests_params: Optional[Dict] = None,
+                     cache: Optional[RpcResponseCache] = None, timeout: Optional[float] = None,
+                     max_connections: Optional[int] = None, connector: Optional[aiohttp.BaseConnector] = None):
 
-        return AsyncHttpRpcClient(endpoint_url)
+        return AsyncHttpRpcClient(
+            endpoint_url, requests_params, cache=cache, timeout=timeout, max_connections=max_connections,
+            connector=connector
+        )
 
     def _init_session(self, **kwargs):
 
         loop = kwargs.get('loop', asyncio.get_event_loop())
+        if self._connector is not None:
+            connector, connector_owner = self._connector, False
+        else:
+            # a single pooled connector lets concurrent requests share keep-alive connections
+            connector, connector_owner = self.create_connector(self._max_connections, loop=loop), True
         session = aiohttp.ClientSession(
             loop=loop,
+            connector=connector,
+            connector_owner=connector_owner,
             headers=self._get_headers(),
             json_serialize=ujson.dumps
         )
         return session
 
-    async def _request(self, path, **kwargs):
+    @classmethod
+    def create_connector(cls, limit: int, limit_per_host: int = 0, loop=None) -> aiohttp.TCPConnector:
+        """Create a keep-alive connector with a DNS cache, which may be shared between clients
 
-        rpc_request = self._get_rpc_request(path, **kwargs)
+        .. code:: python
 
-        response = await self.session.post(self._endpoint_url, data=rpc_request.encode(), headers=self._get_headers())
-        return await self._handle_response(response)
+            connector = AsyncHttpRpcClient.create_connector(limit=200, limit_per_host=10)
+            clients = [AsyncHttpRpcClient(url, connector=connector) for url in node_urls]
 
-    async def _request_session(self, path, params=None):
+        :param limit: max number of connections across all hosts
+        :param limit_per_host: (optional) max number of connections to each host, 0 for no limit
+        """
+        return aiohttp.TCPConnector(
+            loop=loop,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=cls.DNS_CACHE_TTL
+        )
 
+    async def close(self):
+        """Close the underlying session and any pooled connections
+
+        """
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _get_request_kwargs(self, timeout: Optional[float] = None) -> Dict:
+
+        # bound connecting separately so a dead node fails fast
         kwargs = {
-            'params': params,
-            'headers': self._get_headers()
+            'timeout': aiohttp.ClientTimeout(total=timeout or self._timeout, sock_connect=self.CONNECT_TIMEOUT)
         }
 
-        response = await self.session.get(f"{self._endpoint_url}/{path}", **kwargs)
+        # add our global requests params
+        if self._requests_params:
+            kwargs.update(self._requests_params)
+
+        return kwargs
+
+    @staticmethod
+    async def gather(*coros):
+        """Run multiple requests concurrently over the pooled session
+
+        .. code:: python
+
+            block, block_result = await client.gather(
+                client.get_block(10000),
+                client.get_block_result(10000)
+            )
+
+        :return: list of results in the order of the passed coroutines
+
+        """
+        return await asyncio.gather(*coros)
+
+    async def _request(self, path, **kwargs):
+
+        rpc_request = self._get_rpc_request(path, kwargs.get('data'))
+
+        response = await self.session.post(
+            self._endpoint_url, data=rpc_request, **self._get_request_kwargs(kwargs.get('timeout'))
+        )
+        return await self._handle_response(response, kwargs.get('lazy', False))
+
+    async def _request_cached(self, path, data: Dict):
+        cache_key = self._get_cache_key(path, data)
+        res = self._cache.get(cache_key)
+        if res is None:
+            res = await self._request(path, data=data)
+            self._cache.set(cache_key, res)
+        return res
+
+    async def batch_request(self, calls: List[Tuple[str, Optional[Dict]]]) -> List:
+        ids, rpc_request = self._get_rpc_batch_request(calls)
+
+        response = await self.session.post(
+            self._endpoint_url, data=rpc_request, **self._get_request_kwargs()
+        )
+
+        body = await response.read()
+        try:
+            res = json_utils.loads(body)
+        except ValueError:
+            raise BinanceChainRequestException('Invalid Response: %s' % body)
+        return self._handle_batch_results(response, res, ids)
+    batch_request.__doc__ = HttpRpcClient.batch_request.__doc__
+
+    async def _request_session(self, path, params=None):
+
+        kwargs = self._get_request_kwargs()
+        kwargs['params'] = params
+
+        response = await self.session.get(self._get_path_url(path), **kwargs)
 
         return await self._handle_session_response(response)
 
-    async def _handle_response(self, response):
+    async def _handle_response(self, response, lazy: bool = False):
         """Internal helper for handling API responses from the Binance server.
         Raises the appropriate exceptions when necessary; otherwise, returns the
         response.
         """
 
+        body = await response.read()
         try:
-            res = await response.json()
+            res = json_utils.loads_lazy(body) if lazy else json_utils.loads(body)
+        except ValueError:
+            raise BinanceChainRequestException('Invalid Response: %s' % body)
 
-            if 'error' in res and res['error']:
-                raise BinanceChainRPCException(response)
+        if 'error' in res and res['error']:
+            raise BinanceChainRPCException(response, res['error'])
 
-            # by default return full response
-            # if it's a normal response we have a data attribute, return that
-            if 'result' in res:
-                res = res['result']
-            return res
-        except ValueError:
-            raise BinanceChainRequestException('Invalid Response: %s' % response.text)
+        # by default return full response
+        # if it's a normal response we have a data attribute, return that
+        if 'result' in res:
+            res = res['result']
+        return res
 
     async def _handle_session_response(self, response):
         """Internal helper for handling API responses from the Binance server.
         Raises the appropriate exceptions when necessary; otherwise, returns the
         response.
         """
-        if not str(response.status).startswith('2'):
+        if not 200 <= response.status < 300:
             raise BinanceChainRPCException(response)
+        body = await response.read()
         try:
-            res = await response.json()
+            res = json_utils.loads(body)
 
             if 'code' in res and res['code'] != "200000":
                 raise BinanceChainRPCException(response)
@@ -511,96 +984,67 @@ class AsyncHttpRpcClient(BaseHttpRpcClient):
                 res = res['result']
             return res
         except ValueError:
-            raise BinanceChainRequestException('Invalid Response: %s' % await response.text())
+            raise BinanceChainRequestException('Invalid Response: %s' % body)
 
     async def get_path_list(self):
         res = await self.client.session.get(self._endpoint_url)
         return await res.text()
     get_path_list.__doc__ = HttpRpcClient.get_path_list.__doc__
 
-    async def get_abci_info(self):
-        return await self._request('abci_info')
-    get_abci_info.__doc__ = HttpRpcClient.get_abci_info.__doc__
-
-    async def get_consensus_state(self):
-        return await self._request('consensus_state')
-    get_consensus_state.__doc__ = HttpRpcClient.get_consensus_state.__doc__
+    async def abci_query(self, data: str, path: Optional[str] = None,
+                         prove: Optional[bool] = None, height: Optional[int] = None):
+        data = build_params(('data', data), ('path', path), ('prove', prove), ('height', height))
 
-    async def dump_consensus_state(self):
-        return await self._request('dump_consensus_state')
-    dump_consensus_state.__doc__ = HttpRpcClient.dump_consensus_state.__doc__
+        return await self._request('abci_query', data=data)
+    abci_query.__doc__ = HttpRpcClient.abci_query.__doc__
 
-    async def get_genesis(self):
-        return await self._request('genesis')
-    get_genesis.__doc__ = HttpRpcClient.get_genesis.__doc__
+    async def get_block(self, height: Optional[int] = None, lazy: bool = False):
+        data = build_params(('height', height))
+        if lazy:
+            return await self._request('block', data=data, lazy=True)
+        if height:
+            return await self._request_cached('block', data)
+        return await self._request('block', data=data)
+    get_block.__doc__ = HttpRpcClient.get_block.__doc__
 
-    async def get_net_info(self):
-        return await self._request('net_info')
-    get_net_info.__doc__ = HttpRpcClient.get_net_info.__doc__
+    async def get_blocks(self, heights: Iterable[int], concurrency: int = 8) -> List:
+        heights = list(heights)
+        blocks, missing = self._get_cached_blocks(heights)
 
-    async def get_num_unconfirmed_txs(self):
-        return await self._request('num_unconfirmed_txs')
-    get_num_unconfirmed_txs.__doc__ = HttpRpcClient.get_num_unconfirmed_txs.__doc__
+        semaphore = asyncio.Semaphore(concurrency)
 
-    async def get_status(self):
-        return await self._request('status')
-    get_status.__doc__ = HttpRpcClient.get_status.__doc__
+        async def fetch(batch):
+            async with semaphore:
+                return await self.batch_request(batch)
 
-    async def get_health(self):
-        return await self._request('health')
-    get_health.__doc__ = HttpRpcClient.get_health.__doc__
+        results = await asyncio.gather(*[fetch(batch) for batch in self._get_block_batches(missing)])
 
-    async def get_unconfirmed_txs(self):
-        return await self._request('unconfirmed_txs')
-    get_unconfirmed_txs.__doc__ = HttpRpcClient.get_unconfirmed_txs.__doc__
+        self._cache_blocks(blocks, missing, itertools.chain.from_iterable(results))
 
-    async def get_validators(self):
-        return await self._request('validators')
-    get_validators.__doc__ = HttpRpcClient.get_validators.__doc__
+        return [blocks[height] for height in heights]
+    get_blocks.__doc__ = HttpRpcClient.get_blocks.__doc__
 
-    async def abci_query(self, data: str, path: Optional[str] = None,
-                         prove: Optional[bool] = None, height: Optional[int] = None):
-        data = {
-            'data': data
-        }
-        if path:
-            data['path'] = path
-        if prove:
-            data['prove'] = str(prove)
+    async def get_block_result(self, height: int, lazy: bool = False):
+        data = build_params(('height', height))
+        if lazy:
+            return await self._request('block_result', data=data, lazy=True)
         if height:
-            data['height'] = str(height)
-
-        return await self._request('abci_query', data=data)
-    abci_query.__doc__ = HttpRpcClient.abci_query.__doc__
-
-    async def get_block(self, height: Optional[int] = None):
-        data = {
-            'height': str(height) if height else None
-        }
-        return await self._request('block', data=data)
-    get_block.__doc__ = HttpRpcClient.get_block.__doc__
-
-    async def get_block_result(self, height: int):
-        data = {
-            'height': str(height)
-        }
+            return await self._request_cached('block_result', data)
         return await self._request('block_result', data=data)
     get_block_result.__doc__ = HttpRpcClient.get_block_result.__doc__
 
     async def get_block_commit(self, height: int):
-        data = {
-            'height': str(height)
-        }
+        data = build_params(('height', height))
+        if height:
+            return await self._request_cached('commit', data)
         return await self._request('commit', data=data)
     get_block_commit.__doc__ = HttpRpcClient.get_block_commit.__doc__
 
     async def get_blockchain_info(self, min_height: int, max_height: int):
-        assert max_height > min_height
+        if max_height <= min_height:
+            raise BinanceChainRequestException(f'max_height ({max_height}) must be > min_height ({min_height})')
 
-        data = {
-            'minHeight': str(min_height),
-            'maxHeight': str(max_height)
-        }
+        data = build_params(('minHeight', min_height), ('maxHeight', max_height))
 
         return await self._request('blockchain', data=data)
     get_blockchain_info.__doc__ = HttpRpcClient.get_blockchain_info.__doc__
@@ -614,18 +1058,24 @@ class AsyncHttpRpcClient(BaseHttpRpcClient):
             'tx': '0x' + data
         }
 
-        if request_type == RpcBroadcastRequestType.ASYNC:
-            tx_func = self._broadcast_tx_async
-        elif request_type == RpcBroadcastRequestType.COMMIT:
-            tx_func = self._broadcast_tx_commit
-        else:
-            tx_func = self._broadcast_tx_sync
-        res = await tx_func(tx_data)
+        res = await getattr(self, self.BROADCAST_FUNCS[request_type])(tx_data)
 
         msg.wallet.increment_account_sequence()
         return res
     broadcast_msg.__doc__ = HttpRpcClient.broadcast_msg.__doc__
 
+    async def broadcast_msgs(self, msgs: List[Msg],
+                             request_type: RpcBroadcastRequestType = RpcBroadcastRequestType.SYNC):
+        ids, rpc_request = self._get_rpc_batch_request(self._get_broadcast_calls(msgs, request_type))
+        try:
+            response = await self.session.post(self._endpoint_url, data=rpc_request, **self._get_request_kwargs())
+            res = json_utils.loads(await response.read())
+        except Exception:
+            self._reload_broadcast_sequences(msgs)
+            raise
+        return self._handle_broadcast_results(response, res, ids, msgs)
+    broadcast_msgs.__doc__ = HttpRpcClient.broadcast_msgs.__doc__
+
     async def _broadcast_tx_async(self, tx_data: Dict):
         """Returns right away, with no response
 
@@ -644,34 +1094,40 @@ class AsyncHttpRpcClient(BaseHttpRpcClient):
     _broadcast_tx_sync.__doc__ = HttpRpcClient._broadcast_tx_sync.__doc__
 
     async def get_consensus_params(self, height: Optional[int] = None):
-        data = {
-            'height': str(height) if height else None
-        }
+        data = build_params(('height', height))
 
+        if height:
+            return await self._request_cached('consensus_params', data)
         return await self._request('consensus_params', data=data)
     get_consensus_params.__doc__ = HttpRpcClient.get_consensus_params.__doc__
 
     async def get_tx(self, tx_hash: str, prove: Optional[bool] = None):
-        data = {
-            'hash': tx_hash
-        }
-        if prove:
-            data['prove'] = str(prove)
+        data = build_params(('hash', tx_hash), ('prove', prove))
 
+        if not prove:
+            return await self._request_cached('tx', data)
         return await self._request('tx', data=data)
     get_tx.__doc__ = HttpRpcClient.get_tx.__doc__
 
     async def tx_search(self, query: str, prove: Optional[bool] = None,
                         page: Optional[int] = None, limit: Optional[int] = None):
-        data = {
-            'query': query
-        }
-        if prove:
-            data['prove'] = str(prove)
-        if page:
-            data['page'] = str(page)
-        if limit:
-            data['limit'] = str(limit)
+        data = build_params(('query', query), ('prove', prove), ('page', page), ('limit', limit))
 
         return await self._request('tx_search', data=data)
     tx_search.__doc__ = HttpRpcClient.tx_search.__doc__
+
+    async def iter_txs(self, query: str, per_page: int = 100, prove: Optional[bool] = None) -> AsyncIterator[Dict]:
+        page = 1
+        while True:
+            res = await self.tx_search(query, prove=prove, page=page, limit=per_page)
+            txs = res.get('txs') or []
+            for tx in txs:
+                yield tx
+            if len(txs) < per_page:
+                break
+            page += 1
+    iter_txs.__doc__ = HttpRpcClient.iter_txs.__doc__
+
+
+for _name, _path, _doc in _PARAMLESS_METHODS:
+    setattr(AsyncHttpRpcClient, _name, _make_async_paramless_method(_name, _path, _doc))
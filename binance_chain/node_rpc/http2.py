@@ -0,0 +1,50 @@
+from typing import Optional, Dict
+
+import httpx
+
+from binance_chain.node_rpc.http import HttpRpcClient
+
+
+class Http2RpcClient(HttpRpcClient):
+    """Node RPC HTTP client using HTTP/2 via httpx
+
+    Concurrent requests are multiplexed over a single connection to the node instead of needing a socket each.
+
+    .. code:: python
+
+        from binance_chain.node_rpc.http2 import Http2RpcClient
+
+        rpc_client = Http2RpcClient('https://dataseed1.binance.org')
+
+    Connection failures are retried, unlike the requests based client responses with a 5xx status are not.
+
+    """
+
+    def _init_session(self):
+
+        limits = httpx.Limits(max_connections=self._max_connections, max_keepalive_connections=self._max_connections)
+        # only retries failed connections, so broadcasts are never sent twice
+        transport = httpx.HTTPTransport(http2=True, retries=self.MAX_RETRIES, limits=limits)
+        return httpx.Client(transport=transport, headers=self._get_headers())
+
+    def _get_request_kwargs(self, timeout: Optional[float] = None) -> Dict:
+
+        # bound connecting separately so a dead node fails fast
+        kwargs = {
+            'timeout': httpx.Timeout(timeout or self._timeout, connect=self.CONNECT_TIMEOUT)
+        }
+
+        # add our global requests params
+        if self._requests_params:
+            kwargs.update(self._requests_params)
+
+        return kwargs
+
+    def _post(self, rpc_request: bytes, timeout: Optional[float] = None):
+        return self.session.post(
+            self._endpoint_url, content=rpc_request, **self._get_request_kwargs(timeout)
+        )
+
+    def _post_broadcast(self, rpc_request: bytes):
+        # the transport only retries failed connections, so broadcasts can share the session
+        return self._post(rpc_request)
@@ -1,14 +1,21 @@
 import asyncio
+import itertools
 import logging
-from typing import Optional
+import time
+from typing import Optional, Dict, Iterable, List, Tuple
 from random import shuffle
 
 
 from binance_chain.http import AsyncHttpApiClient
 from binance_chain.environment import BinanceEnvironment
 from binance_chain.node_rpc.http import AsyncHttpRpcClient
+from binance_chain.node_rpc.cache import RpcResponseCache
 from binance_chain.constants import RpcBroadcastRequestType
 from binance_chain.messages import Msg
+from binance_chain.exceptions import BinanceChainRequestException
+
+
+log = logging.getLogger(__name__)
 
 
 class PooledRpcClient:
@@ -18,17 +25,28 @@ class PooledRpcClient:
 
     """
 
-    def __init__(self, env: Optional[BinanceEnvironment] = None):
+    MAX_CONNECTIONS = 200
+    MAX_CONNECTIONS_PER_PEER = 10
+    PEERS_CACHE_TTL = 60
+
+    # environment api url -> (time fetched, peers)
+    _peers_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+
+    def __init__(self, env: Optional[BinanceEnvironment] = None, cache: Optional[RpcResponseCache] = None):
 
         self._env = env
-        self._clients = [AsyncHttpRpcClient]
+        # requests are spread over the peers, they share one cache so a response cached from one serves them all
+        self._cache = cache if cache is not None else RpcResponseCache()
+        self._connector = None
+        self._clients = []
+        self._client_cycle = itertools.cycle(self._clients)
         self._loop = None
-        self._client_idx = 0
 
     @classmethod
-    async def create(cls, loop=None, env: Optional[BinanceEnvironment] = None) -> 'PooledRpcClient':
+    async def create(cls, loop=None, env: Optional[BinanceEnvironment] = None,
+                     cache: Optional[RpcResponseCache] = None) -> 'PooledRpcClient':
 
-        self = PooledRpcClient(env=env)
+        self = PooledRpcClient(env=env, cache=cache)
         self._loop = loop or asyncio.get_event_loop()
 
         await self.initialise_clients()
@@ -38,33 +56,107 @@ class PooledRpcClient:
     async def initialise_clients(self) -> None:
         """Initialise the client connections used
 
+        The peer list is shared between instances for the same environment for PEERS_CACHE_TTL seconds
+
         :return:
         """
+        await self._update_clients(await self._get_peers())
+
+    async def refresh_peers(self) -> None:
+        """Fetch the current peer list, creating clients for new peers and closing clients for peers that have gone
+
+        :return:
+        """
+        await self._update_clients(await self._get_peers(refresh=True))
+
+    async def _get_peers(self, refresh: bool = False) -> List[Dict]:
+        env_key = (self._env or BinanceEnvironment.get_production_env()).api_url
+        cached = self._peers_cache.get(env_key)
+        if not refresh and cached and time.monotonic() - cached[0] < self.PEERS_CACHE_TTL:
+            return cached[1]
+
         client = await AsyncHttpApiClient.create(loop=self._loop, env=self._env)
-        peers = await client.get_node_peers()
-        shuffle(peers)
+        try:
+            peers = await client.get_node_peers()
+        finally:
+            await client.session.close()
+
+        self._peers_cache[env_key] = (time.monotonic(), peers)
+        return peers
+
+    async def _update_clients(self, peers: List[Dict]) -> None:
+        # peer clients share one connection pool, DNS cache and response cache
+        if self._connector is None:
+            self._connector = AsyncHttpRpcClient.create_connector(
+                limit=self.MAX_CONNECTIONS, limit_per_host=self.MAX_CONNECTIONS_PER_PEER, loop=self._loop
+            )
+
+        existing = {client._endpoint_url: client for client in self._clients}
+        endpoint_urls = list(dict.fromkeys(peer['listen_addr'] for peer in peers))
+        shuffle(endpoint_urls)
+
+        clients = await asyncio.gather(*[
+            AsyncHttpRpcClient.create(endpoint_url=url, cache=self._cache, connector=self._connector)
+            for url in endpoint_urls if url not in existing
+        ])
+        new_clients = iter(clients)
+        self._set_clients([existing.get(url) or next(new_clients) for url in endpoint_urls])
+
+        await asyncio.gather(*[client.close() for url, client in existing.items() if url not in endpoint_urls])
+        log.debug("Connected to %d peers", self.num_peers)
+
+    async def close(self):
+        """Close the sessions of all peer clients and their shared connection pool
 
-        self._clients = []
-        for peer in peers:
-            logging.info(f"Creating client {peer['listen_addr']}")
-            self._clients.append(await AsyncHttpRpcClient.create(endpoint_url=peer['listen_addr']))
-        logging.debug(f"Connected to {self.num_peers} peers")
+        """
+        await asyncio.gather(*[client.close() for client in self._clients])
+        self._set_clients([])
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _set_clients(self, clients):
+        self._clients = list(clients)
+        self._client_cycle = itertools.cycle(self._clients)
 
     @property
     def num_peers(self):
         return len(self._clients)
 
-    async def _request(self, func_name, params=None):
-        params = params or {}
-        if params.get('self'):
-            del params['self']
-        client = self._get_client()
-        return await getattr(client, func_name)(**params)
+    async def _request(self, func_name, **params):
+        return await getattr(self._get_client(), func_name)(**params)
+
+    async def gather(self, calls: Iterable[Tuple[str, Optional[Dict]]]) -> List:
+        """Run multiple requests concurrently, spreading them across the peer clients
+
+        Results are returned in the same order as the calls. Exceptions are returned in place of the result
+        for calls that failed rather than raised, so one bad peer doesn't lose the other results.
+
+        .. code:: python
+
+            blocks = await prc.gather(('get_block', {'height': height}) for height in range(10000, 10100))
+
+        :param calls: iterable of (method name, kwargs) tuples, kwargs may be None
+        :return: list of results or exceptions
+
+        """
+        coros = [getattr(self._get_client(), func_name)(**(params or {})) for func_name, params in calls]
+        return await asyncio.gather(*coros, return_exceptions=True)
 
     def _get_client(self):
-        logging.debug(f"using client {self._client_idx}")
-        client = self._clients[self._client_idx]
-        self._client_idx = (self._client_idx + 1) % len(self._clients)
+        try:
+            client = next(self._client_cycle)
+        except StopIteration:
+            raise BinanceChainRequestException('No peer clients available, call initialise_clients first')
+        # called for every request, skip formatting the message unless debug logging is on
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("using client %s", client._endpoint_url)
         return client
 
     async def get_path_list(self):
@@ -113,38 +205,38 @@ class PooledRpcClient:
 
     async def abci_query(self, data: str, path: Optional[str] = None,
                          prove: Optional[bool] = None, height: Optional[int] = None):
-        return await self._request('abci_query', locals())
+        return await self._request('abci_query', data=data, path=path, prove=prove, height=height)
     abci_query.__doc__ = AsyncHttpRpcClient.abci_query.__doc__
 
-    async def get_block(self, height: Optional[int] = None):
-        return await self._request('get_block', locals())
+    async def get_block(self, height: Optional[int] = None, lazy: bool = False):
+        return await self._request('get_block', height=height, lazy=lazy)
     get_block.__doc__ = AsyncHttpRpcClient.get_block.__doc__
 
-    async def get_block_result(self, height: int):
-        return await self._request('get_block_result', locals())
+    async def get_block_result(self, height: int, lazy: bool = False):
+        return await self._request('get_block_result', height=height, lazy=lazy)
     get_block_result.__doc__ = AsyncHttpRpcClient.get_block_result.__doc__
 
     async def get_block_commit(self, height: int):
-        return await self._request('get_block_commit', locals())
+        return await self._request('get_block_commit', height=height)
     get_block_commit.__doc__ = AsyncHttpRpcClient.get_block_commit.__doc__
 
     async def get_blockchain_info(self, min_height: int, max_height: int):
-        return await self._request('get_blockchain_info', locals())
+        return await self._request('get_blockchain_info', min_height=min_height, max_height=max_height)
     get_blockchain_info.__doc__ = AsyncHttpRpcClient.get_blockchain_info.__doc__
 
     async def broadcast_msg(self, msg: Msg, request_type: RpcBroadcastRequestType = RpcBroadcastRequestType.SYNC):
-        return await self._request('broadcast_msg', locals())
+        return await self._request('broadcast_msg', msg=msg, request_type=request_type)
     broadcast_msg.__doc__ = AsyncHttpRpcClient.broadcast_msg.__doc__
 
     async def get_consensus_params(self, height: Optional[int] = None):
-        return await self._request('get_consensus_params', locals())
+        return await self._request('get_consensus_params', height=height)
     get_consensus_params.__doc__ = AsyncHttpRpcClient.get_consensus_params.__doc__
 
     async def get_tx(self, tx_hash: str, prove: Optional[bool] = None):
-        return await self._request('get_tx', locals())
+        return await self._request('get_tx', tx_hash=tx_hash, prove=prove)
     get_tx.__doc__ = AsyncHttpRpcClient.get_tx.__doc__
 
     async def tx_search(self, query: str, prove: Optional[bool] = None,
                         page: Optional[int] = None, limit: Optional[int] = None):
-        return await self._request('tx_search', locals())
+        return await self._request('tx_search', query=query, prove=prove, page=page, limit=limit)
     tx_search.__doc__ = AsyncHttpRpcClient.tx_search.__doc__
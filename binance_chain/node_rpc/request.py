@@ -1,5 +1,7 @@
-import ujson as json
-from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+from binance_chain.utils import json_utils
 
 
 class RpcRequest:
@@ -10,19 +12,95 @@ class RpcRequest:
         self._params = params
         self._id = id
 
-    def _sort_request(self, request):
-        sort_order = ["jsonrpc", "method", "params", "id"]
-        return OrderedDict(sorted(request.items(), key=lambda k: sort_order.index(k[0])))
+    def __bytes__(self):
+
+        # keys are inserted in the jsonrpc, method, params, id order
+        if self._params:
+            request = {
+                'jsonrpc': '2.0',
+                'method': self._method,
+                'params': self._params,
+                'id': self._id
+            }
+        else:
+            request = {
+                'jsonrpc': '2.0',
+                'method': self._method,
+                'id': self._id
+            }
+
+        return json_utils.dumps(request)
 
     def __str__(self):
+        return bytes(self).decode()
 
-        request = {
-            'jsonrpc': '2.0',
-            'method': self._method,
-            'id': self._id
-        }
 
-        if self._params:
-            request['params'] = self._params
+@lru_cache(maxsize=None)
+def get_request_template(method: str) -> bytes:
+    """Serialised request for a method without params, with a %d placeholder for the request id
+
+    Equivalent to str(RpcRequest(method, id)) but only serialised once per method
+
+    """
+    return b'{"jsonrpc":"2.0","method":%s,"id":%%d}' % json_utils.dumps(method)
+
+
+@lru_cache(maxsize=256)
+def get_params_request_template(method: str, keys: Tuple[str, ...]) -> bytes:
+    """Serialised request for a method and set of param keys, with a %s placeholder for each JSON encoded param
+    value followed by a %d placeholder for the request id
+
+    .. code:: python
+
+        get_params_request_template('block', ('height', )) % (b'"10"', 1)
+        # b'{"jsonrpc":"2.0","method":"block","params":{"height":"10"},"id":1}'
+
+    """
+    params = b','.join(b'%s:%%s' % json_utils.dumps(key) for key in keys)
+    return b'{"jsonrpc":"2.0","method":%s,"params":{%s},"id":%%d}' % (json_utils.dumps(method), params)
+
+
+def format_request(method: str, id: int, params: Dict[str, Any]) -> bytes:
+    """Serialise a request with params, equivalent to bytes(RpcRequest(method, id, params))
+
+    Only the param values are encoded, the rest of the request comes from a cached template
+
+    """
+    values = tuple(json_utils.dumps(value) for value in params.values())
+    return get_params_request_template(method, tuple(params)) % (values + (id, ))
+
+
+def format_encoded_request(method: str, id: int, params: Dict[str, bytes]) -> bytes:
+    """Serialise a request with params whose values are already JSON encoded, they are inserted as is
+
+    .. code:: python
+
+        format_encoded_request('broadcast_tx_sync', 1, {'tx': b'"0x%s"' % hex_data})
+
+    """
+    return get_params_request_template(method, tuple(params)) % (tuple(params.values()) + (id, ))
+
+
+def format_param(value: Any) -> str:
+    """Format a param value as the string expected by the node, booleans are lowercase
+
+    Integers are sent as strings as the node's amino JSON decoder rejects unquoted int64 values
+
+    """
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    return str(value)
+
+
+def build_params(*params: Tuple[str, Any]) -> Dict[str, str]:
+    """Build a request params dict from (key, value) pairs, skipping any None values
+
+    .. code:: python
+
+        build_params(('query', "tx.height=5"), ('prove', True), ('page', None))
+        # {'query': 'tx.height=5', 'prove': 'true'}
 
-        return json.dumps(self._sort_request(request), ensure_ascii=False)
+    """
+    return {key: format_param(value) for key, value in params if value is not None}
@@ -1,62 +1,385 @@
 import asyncio
 import itertools
-from typing import Callable, Awaitable, Optional, Dict
+import re
+import socket
+import weakref
+from socket import IPPROTO_TCP, TCP_NODELAY
+from typing import Callable, Awaitable, Optional, Dict, List, Tuple
 
-from binance_chain.node_rpc.http import HttpRpcClient
+from binance_chain.node_rpc.http import HttpRpcClient, _PARAMLESS_METHODS
 from binance_chain.websockets import ReconnectingWebsocket, BinanceChainSocketManagerBase
 from binance_chain.environment import BinanceEnvironment
 from binance_chain.constants import RpcBroadcastRequestType
 from binance_chain.messages import Msg
-from binance_chain.node_rpc.request import RpcRequest
+from binance_chain.exceptions import BinanceChainRequestException
+from binance_chain.node_rpc.request import get_request_template, format_request, format_encoded_request, build_params
+
+
+# not available on every platform
+TCP_NOTSENT_LOWAT = getattr(socket, 'TCP_NOTSENT_LOWAT', None)
+
+# "condition AND condition ...", condition keys can't contain whitespace or \()"'=><, see subscribe
+_QUERY_CONDITION = r"""[^\s\\()"'=><]+\s*(?:<=|>=|<|>|=|\sCONTAINS\s)\s*(?:(?:TIME|DATE)\s+)?(?:'[^']*'|[^\s']+)"""
+_QUERY_RE = re.compile(rf"\s*{_QUERY_CONDITION}(?:\s+AND\s+{_QUERY_CONDITION})*\s*")
+
+# requests without params only differ by id, serialised once at import
+_STATIC_FRAMES = {
+    method: get_request_template(method)
+    for method in ('ping', 'keepAlive', 'unsubscribe_all') + tuple(path for _, path, _ in _PARAMLESS_METHODS)
+}
+
+# wallet -> lock held from signing a broadcast until its sequence is incremented, shared by every client as
+# clients on the same connection can broadcast for the same wallet
+_WALLET_LOCKS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _make_paramless_method(name: str, path: str, doc: str):
+    async def method(self):
+        await self._conn.send_rpc_message(path)
+    method.__name__ = method.__qualname__ = name
+    method.__doc__ = doc
+    return method
 
 
 class ReconnectingRpcWebsocket(ReconnectingWebsocket):
 
     id_generator = itertools.count(1)
 
+    MAX_SEND_BATCH: int = 100
+    NOTSENT_LOWAT: int = 16384
+
+    def __init__(self, loop, coro, env: BinanceEnvironment):
+        """Connection to a node websocket, which can be shared by multiple consumers
+
+        Replies are routed to the callback registered with the request id and subscription events to every
+        subscriber of the query, anything else is passed to every consumer
+
+        :param coro: (optional) default consumer of messages
+        """
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._send_task: Optional[asyncio.Future] = None
+        # id of the last request the writer has taken off the queue
+        self._last_sent_id: int = 0
+        # request id -> callback for the reply
+        self._routes: Dict[int, Callable] = {}
+        # the node allows one subscription per query on a connection, consumers subscribing to the same query share it
+        # query -> subscribed callbacks, subscribe request id -> query, and query -> request id of a subscribe in flight
+        self._subscribers: Dict[str, List[Callable]] = {}
+        self._subscription_ids: Dict[int, str] = {}
+        self._pending_subscriptions: Dict[str, asyncio.Future] = {}
+        self._consumers: List[Callable] = [coro] if coro else []
+        super().__init__(loop, self._dispatch, env=env)
+
+    def add_consumer(self, coro: Callable[[Dict], Awaitable]):
+        self._consumers.append(coro)
+
+    async def remove_consumer(self, coro: Callable[[Dict], Awaitable]) -> int:
+        """Remove a consumer, its routes and subscriptions, returns the number of consumers remaining"""
+        if coro in self._consumers:
+            self._consumers.remove(coro)
+        for req_id in [req_id for req_id, callback in self._routes.items() if callback == coro]:
+            del self._routes[req_id]
+        for query in [query for query, subscribers in self._subscribers.items() if coro in subscribers]:
+            # no need to unsubscribe when the connection is about to be closed
+            if self._consumers:
+                await self.unsubscribe(query, coro)
+            else:
+                self._remove_subscriber(query, coro)
+        return len(self._consumers)
+
+    async def subscribe(self, query: str, callback: Callable[[Dict], Awaitable]) -> Optional[int]:
+        """Subscribe a callback to events for query, the subscribe request is only sent for the first subscriber
+
+        :return: subscribe request id, or None if not connected
+        """
+        subscribers = self._subscribers.setdefault(query, [])
+        added = callback not in subscribers
+        if added:
+            subscribers.append(callback)
+        req_id = self._get_subscription_id(query)
+        if req_id is None:
+            pending = self._pending_subscriptions.get(query)
+            if pending is not None:
+                # another subscriber is sending the request, wait for its id
+                req_id = await asyncio.shield(pending)
+            else:
+                req_id = await self._send_subscribe(query)
+        # leave subscribers added by other calls in place, a later subscribe sends the request again
+        if req_id is None and added:
+            self._remove_subscriber(query, callback)
+        return req_id
+
+    async def _send_subscribe(self, query: str) -> Optional[int]:
+        pending = self._pending_subscriptions[query] = asyncio.get_event_loop().create_future()
+        req_id = None
+        try:
+            req_id = await self.send_rpc_message('subscribe', {'query': query})
+            # the last subscriber may have unsubscribed while the request was queued
+            if req_id is not None and query in self._subscribers:
+                self._subscription_ids[req_id] = query
+        finally:
+            if self._pending_subscriptions.get(query) is pending:
+                del self._pending_subscriptions[query]
+            pending.set_result(req_id)
+        return req_id
+
+    def _get_subscription_id(self, query: str) -> Optional[int]:
+        return next((req_id for req_id, q in self._subscription_ids.items() if q == query), None)
+
+    async def unsubscribe(self, query: str, callback: Callable[[Dict], Awaitable]):
+        """Unsubscribe a callback from query, the unsubscribe request is only sent once no subscribers are left"""
+        subscribers = self._subscribers.get(query)
+        if subscribers is not None:
+            if callback not in subscribers:
+                return
+            subscribers.remove(callback)
+            if subscribers:
+                return
+            self._remove_subscription(query)
+        await self.send_rpc_message('unsubscribe', {'query': query}, callback=callback)
+
+    async def unsubscribe_all(self, callback: Callable[[Dict], Awaitable]):
+        """Unsubscribe a callback from all its queries, leaving other subscribers' subscriptions in place"""
+        for query in [query for query, subscribers in self._subscribers.items() if callback in subscribers]:
+            await self.unsubscribe(query, callback)
+
+    def _remove_subscriber(self, query: str, callback: Callable[[Dict], Awaitable]):
+        subscribers = self._subscribers.get(query)
+        if subscribers is not None and callback in subscribers:
+            subscribers.remove(callback)
+            if not subscribers:
+                self._remove_subscription(query)
+
+    def _remove_subscription(self, query: str):
+        self._subscribers.pop(query, None)
+        for req_id in [req_id for req_id, q in self._subscription_ids.items() if q == query]:
+            del self._subscription_ids[req_id]
+
+    async def _dispatch(self, msg: Dict):
+        callbacks = self._get_callbacks(msg.get('id'))
+        for callback in callbacks if callbacks is not None else list(self._consumers):
+            await callback(msg)
+
+    def _get_callbacks(self, msg_id) -> Optional[List[Callable]]:
+        # subscription events carry the subscribe request id with an #event suffix
+        if isinstance(msg_id, str) and msg_id.endswith('#event'):
+            try:
+                msg_id = int(msg_id[:-6])
+            except ValueError:
+                return None
+        query = self._subscription_ids.get(msg_id)
+        if query is not None:
+            return list(self._subscribers.get(query, ()))
+        callback = self._routes.pop(msg_id, None)
+        return [callback] if callback is not None else None
+
     def _get_ws_endpoint_url(self):
         return f"{self._env.wss_url}/websocket"
 
+    def _on_connect(self, socket):
+        super()._on_connect(socket)
+        self._tune_socket(socket.transport.get_extra_info('socket'))
+        self._resubscribe()
+
+    def _resubscribe(self):
+        # replies to requests written to a previous connection won't arrive and the node dropped its subscriptions,
+        # requests still queued go out on this connection
+        for req_id in [req_id for req_id in self._routes if req_id <= self._last_sent_id]:
+            del self._routes[req_id]
+        queries = set()
+        for req_id in [req_id for req_id in self._subscription_ids if req_id <= self._last_sent_id]:
+            queries.add(self._subscription_ids.pop(req_id))
+        for query in queries:
+            if query in self._subscribers:
+                asyncio.ensure_future(self._send_subscribe(query))
+
+    def _tune_socket(self, sock):
+        # small frames should go out immediately and not queue up behind unsent data in the kernel
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+            if TCP_NOTSENT_LOWAT is not None:
+                sock.setsockopt(IPPROTO_TCP, TCP_NOTSENT_LOWAT, self.NOTSENT_LOWAT)
+        except OSError as e:
+            self._log.debug('unable to set socket options:{}'.format(e))
+
     async def send_keepalive(self):
         await self.send_rpc_message('keepAlive')
 
-    async def send_rpc_message(self, method, params=None, retry_count=0):
-        if not self._socket:
-            if retry_count < 5:
-                await asyncio.sleep(1)
-                await self.send_rpc_message(method, params, retry_count + 1)
-        else:
-            req = RpcRequest(method, next(self.id_generator), params)
-            await self._socket.send(str(req))
+    async def send_rpc_message(self, method, params=None, callback: Optional[Callable] = None,
+                               encoded: bool = False) -> Optional[int]:
+        """Queue a message to be sent by the writer task
+
+        Frames are drained from the queue in batches and written by a single writer task in the order they were queued
+
+        :param callback: (optional) consumer to route the reply to
+        :param encoded: param values are already JSON encoded bytes
+        :return: request id, or None if not connected
+        """
+        if not await self._wait_for_socket():
+            return None
+        if self._send_task is None or self._send_task.done():
+            self._send_task = asyncio.ensure_future(self._send_messages())
+            self._send_task.add_done_callback(self._on_send_task_done)
+        req_id = next(self.id_generator)
+        if callback is not None:
+            self._routes[req_id] = callback
+        self._send_queue.put_nowait((req_id, self._get_rpc_message(method, params, req_id, encoded)))
+        return req_id
+
+    async def flush(self):
+        """Wait until all queued messages have been written"""
+        await self._send_queue.join()
+
+    def _on_send_task_done(self, task: asyncio.Future):
+        # retrieve the exception so it is logged here rather than reported when the task is garbage collected
+        if not task.cancelled() and task.exception() is not None:
+            self._log.info('ws writer stopped:{}'.format(task.exception()))
+
+    async def _send_messages(self):
+        while True:
+            messages = [await self._send_queue.get()]
+            while len(messages) < self.MAX_SEND_BATCH and not self._send_queue.empty():
+                messages.append(self._send_queue.get_nowait())
+            try:
+                if await self._wait_for_socket():
+                    for _, message in messages:
+                        await self._socket.send(message)
+            except Exception as e:
+                self._log.debug('ws send exception:{}'.format(e))
+            finally:
+                self._last_sent_id = messages[-1][0]
+                for _ in messages:
+                    self._send_queue.task_done()
+
+    @staticmethod
+    def _get_rpc_message(method, params, req_id: int, encoded: bool = False) -> bytes:
+        # serialised from the cached request templates, only the param values and id are encoded per call
+        if params:
+            if encoded:
+                return format_encoded_request(method, req_id, params)
+            return format_request(method, req_id, params)
+        template = _STATIC_FRAMES.get(method)
+        if template is None:
+            template = get_request_template(method)
+        return template % req_id
 
     async def ping(self):
         await self.send_rpc_message('ping')
 
     async def cancel(self):
+        if self._send_task is not None:
+            self._send_task.cancel()
         try:
             self._conn.cancel()
         except asyncio.CancelledError:
             pass
 
 
+class _RpcConnectionView:
+    """A single client's view of a shared ReconnectingRpcWebsocket, routes replies to the client's callback"""
+
+    def __init__(self, conn: ReconnectingRpcWebsocket, callback: Callable[[Dict], Awaitable]):
+        self._shared = conn
+        self._callback = callback
+        conn.add_consumer(callback)
+
+    async def send_rpc_message(self, method, params=None, encoded: bool = False) -> Optional[int]:
+        # subscriptions are shared with other clients subscribed to the same query
+        if method == 'subscribe':
+            return await self._shared.subscribe(params['query'], self._callback)
+        elif method == 'unsubscribe':
+            await self._shared.unsubscribe(params['query'], self._callback)
+        elif method == 'unsubscribe_all':
+            await self._shared.unsubscribe_all(self._callback)
+        else:
+            return await self._shared.send_rpc_message(method, params, callback=self._callback, encoded=encoded)
+        return None
+
+    async def close(self) -> int:
+        return await self._shared.remove_consumer(self._callback)
+
+
 class WebsocketRpcClient(BinanceChainSocketManagerBase):
 
+    # (wss url, loop) -> connection shared by the clients for that node
+    _SHARED: Dict[Tuple[str, object], ReconnectingRpcWebsocket] = {}
+
+    CALLBACK_QUEUE_SIZE: int = 1024
+
+    def __init__(self, env: BinanceEnvironment):
+        super().__init__(env)
+        # messages wait here for the callback so a slow client doesn't hold up others on the shared connection,
+        # once CALLBACK_QUEUE_SIZE messages are waiting further events for this client are dropped, replies to its
+        # own requests are always queued
+        self._callback_queue: asyncio.Queue = asyncio.Queue()
+        self._callback_task: Optional[asyncio.Future] = None
+
     @classmethod
     async def create(cls, loop, callback: Callable[[int], Awaitable[str]], env: Optional[BinanceEnvironment] = None):
         """Create a BinanceChainSocketManager instance
 
-        :param loop: asyncio loop
+        Clients for the same node share a single websocket connection, each receives the replies and subscription
+        events for its own requests
+
+        :param loop: asyncio loop, a uvloop loop can be used for faster socket handling
         :param callback: async callback function to receive messages
         :param env:
         :return:
         """
         env = env or BinanceEnvironment.get_production_env()
-        self = WebsocketRpcClient(env=env)
+        self = cls(env=env)
         self._loop = loop
         self._callback = callback
-        self._conn = ReconnectingRpcWebsocket(loop, self._recv, env=env)
+        self._conn = _RpcConnectionView(cls._get_shared_connection(loop, env), self._recv)
         return self
 
+    @classmethod
+    def _get_shared_connection(cls, loop, env: BinanceEnvironment) -> ReconnectingRpcWebsocket:
+        key = (env.wss_url, loop)
+        conn = cls._SHARED.get(key)
+        if conn is None or conn._conn.done():
+            conn = cls._SHARED[key] = ReconnectingRpcWebsocket(loop, None, env=env)
+        return conn
+
+    async def _recv(self, msg: Dict):
+        if self._callback_task is None or self._callback_task.done():
+            self._callback_task = asyncio.ensure_future(self._run_callbacks())
+        # waiting for space would stall the reader shared with other clients, drop the event instead
+        msg_id = msg.get('id')
+        if not isinstance(msg_id, int) and self._callback_queue.qsize() >= self.CALLBACK_QUEUE_SIZE:
+            self._log.warning('callback queue full, dropping message id:{}'.format(msg_id))
+            return
+        self._callback_queue.put_nowait(msg)
+
+    async def _run_callbacks(self):
+        while True:
+            msg = await self._callback_queue.get()
+            try:
+                await self._callback(msg)
+            except Exception as e:
+                self._log.info('callback exception:{}'.format(e))
+            finally:
+                self._callback_queue.task_done()
+
+    async def close(self):
+        """Stop receiving messages, the shared connection is closed once its last client has closed
+
+        .. code:: python
+
+            await wrc.close()
+
+        """
+        if self._callback_task is not None:
+            self._callback_task.cancel()
+        if await self._conn.close() == 0:
+            conn = self._conn._shared
+            for key, shared in list(self._SHARED.items()):
+                if shared is conn:
+                    del self._SHARED[key]
+            await conn.cancel()
+
     async def subscribe(self, query):
         """Subscribe for events via WebSocket.
 
@@ -68,13 +391,42 @@ class WebsocketRpcClient(BinanceChainSocketManagerBase):
         can be "=", "<", "<=", ">", ">=", "CONTAINS". operand can be a string (escaped with single quotes),
         number, date or time.
 
+        :raises: BinanceChainRequestException if the query is not of this form
 
         """
+        if not _QUERY_RE.fullmatch(query):
+            raise BinanceChainRequestException(f'Invalid subscribe query: {query}')
+
         req_msg = {
             "query": query
         }
         await self._conn.send_rpc_message('subscribe', req_msg)
 
+    async def subscribe_new_block(self):
+        """Subscribe to new block events, each block is pushed as it is committed
+
+        .. code:: python
+
+            await wrc.subscribe_new_block()
+
+        """
+        await self.subscribe("tm.event = 'NewBlock'")
+
+    async def subscribe_tx(self, query: Optional[str] = None):
+        """Subscribe to transaction events, optionally filtered by a query
+
+        .. code:: python
+
+            await wrc.subscribe_tx("tx.height = 1000")
+
+        :param query: (optional) conditions to combine with the Tx event condition
+
+        """
+        tx_query = "tm.event = 'Tx'"
+        if query:
+            tx_query = f"{tx_query} AND {query}"
+        await self.subscribe(tx_query)
+
     async def unsubscribe(self, query):
         """Unsubscribe from events via WebSocket.
 
@@ -94,110 +446,58 @@ class WebsocketRpcClient(BinanceChainSocketManagerBase):
         """
         await self._conn.send_rpc_message('unsubscribe_all')
 
-    async def get_abci_info(self):
-        await self._conn.send_rpc_message('abci_info')
-    get_abci_info.__doc__ = HttpRpcClient.get_abci_info.__doc__
-
-    async def get_consensus_state(self):
-        await self._conn.send_rpc_message('consensus_state')
-    get_consensus_state.__doc__ = HttpRpcClient.get_consensus_state.__doc__
-
-    async def dump_consensus_state(self):
-        await self._conn.send_rpc_message('dump_consensus_state')
-    dump_consensus_state.__doc__ = HttpRpcClient.dump_consensus_state.__doc__
-
-    async def get_genesis(self):
-        await self._conn.send_rpc_message('genesis')
-    dump_consensus_state.__doc__ = HttpRpcClient.dump_consensus_state.__doc__
-
-    async def get_net_info(self):
-        await self._conn.send_rpc_message('net_info')
-    get_net_info.__doc__ = HttpRpcClient.get_net_info.__doc__
-
-    async def get_num_unconfirmed_txs(self):
-        await self._conn.send_rpc_message('num_unconfirmed_txs')
-    get_num_unconfirmed_txs.__doc__ = HttpRpcClient.get_num_unconfirmed_txs.__doc__
-
-    async def get_status(self):
-        await self._conn.send_rpc_message('status')
-    get_status.__doc__ = HttpRpcClient.get_status.__doc__
-
-    async def get_health(self):
-        await self._conn.send_rpc_message('health')
-    get_health.__doc__ = HttpRpcClient.get_health.__doc__
-
-    async def get_unconfirmed_txs(self):
-        await self._conn.send_rpc_message('unconfirmed_txs')
-    get_unconfirmed_txs.__doc__ = HttpRpcClient.get_unconfirmed_txs.__doc__
-
-    async def get_validators(self):
-        await self._conn.send_rpc_message('validators')
-    get_validators.__doc__ = HttpRpcClient.get_validators.__doc__
-
     async def abci_query(self, data: str, path: Optional[str] = None,
                          prove: Optional[bool] = None, height: Optional[int] = None):
-        data = {
-            'data': data
-        }
-        if path:
-            data['path'] = path
-        if prove:
-            data['prove'] = str(prove)
-        if height:
-            data['height'] = str(height)
+        data = build_params(('data', data), ('path', path), ('prove', prove), ('height', height))
 
         await self._conn.send_rpc_message('abci_query', data)
     abci_query.__doc__ = HttpRpcClient.abci_query.__doc__
 
     async def get_block(self, height: Optional[int] = None):
-        data = {
-            'height': str(height) if height else None
-        }
+        data = build_params(('height', height))
         await self._conn.send_rpc_message('block', data)
     get_block.__doc__ = HttpRpcClient.get_block.__doc__
 
     async def get_block_result(self, height: int):
-        data = {
-            'height': str(height)
-        }
+        data = build_params(('height', height))
         await self._conn.send_rpc_message('block_result', data)
     get_block_result.__doc__ = HttpRpcClient.get_block_result.__doc__
 
     async def get_block_commit(self, height: int):
-        data = {
-            'height': str(height)
-        }
+        data = build_params(('height', height))
         await self._conn.send_rpc_message('commit', data)
     get_block_commit.__doc__ = HttpRpcClient.get_block_commit.__doc__
 
     async def get_blockchain_info(self, min_height: int, max_height: int):
-        assert max_height > min_height
+        if max_height <= min_height:
+            raise BinanceChainRequestException(f'max_height ({max_height}) must be > min_height ({min_height})')
 
-        data = {
-            'minHeight': str(min_height),
-            'maxHeight': str(max_height)
-        }
+        data = build_params(('minHeight', min_height), ('maxHeight', max_height))
         await self._conn.send_rpc_message('blockchain', data)
     get_blockchain_info.__doc__ = HttpRpcClient.get_blockchain_info.__doc__
 
     async def broadcast_msg(self, msg: Msg, request_type: RpcBroadcastRequestType = RpcBroadcastRequestType.SYNC):
 
-        msg.wallet.initialise_wallet()
-        data = msg.to_hex_data().decode()
+        # concurrent broadcasts from a wallet must each be signed with the sequence left by the previous one
+        lock = _WALLET_LOCKS.get(msg.wallet)
+        if lock is None:
+            lock = _WALLET_LOCKS[msg.wallet] = asyncio.Lock()
 
-        tx_data = {
-            'tx': '0x' + data
-        }
+        async with lock:
+            msg.wallet.initialise_wallet()
 
-        if request_type == RpcBroadcastRequestType.ASYNC:
-            tx_func = self._broadcast_tx_async
-        elif request_type == RpcBroadcastRequestType.COMMIT:
-            tx_func = self._broadcast_tx_commit
-        else:
-            tx_func = self._broadcast_tx_sync
-        res = await tx_func(tx_data)
+            # hex is JSON safe, splice it into the request rather than decoding and re-encoding it
+            tx_data = {
+                'tx': b'"0x%s"' % msg.to_hex_data()
+            }
 
-        msg.wallet.increment_account_sequence()
+            res = await self._conn.send_rpc_message(
+                HttpRpcClient.BROADCAST_PATHS[request_type], tx_data, encoded=True
+            )
+
+            # nothing was sent if not connected, the sequence is still unused
+            if res is not None:
+                msg.wallet.increment_account_sequence()
         return res
     broadcast_msg.__doc__ = HttpRpcClient.broadcast_msg.__doc__
 
@@ -214,33 +514,23 @@ class WebsocketRpcClient(BinanceChainSocketManagerBase):
     _broadcast_tx_sync.__doc__ = HttpRpcClient._broadcast_tx_sync.__doc__
 
     async def get_consensus_params(self, height: Optional[int] = None):
-        data = {
-            'height': str(height) if height else None
-        }
+        data = build_params(('height', height))
         await self._conn.send_rpc_message('consensus_params', data)
     get_consensus_params.__doc__ = HttpRpcClient.get_consensus_params.__doc__
 
     async def get_tx(self, tx_hash: str, prove: Optional[bool] = None):
-        data = {
-            'hash': tx_hash
-        }
-        if prove:
-            data['prove'] = str(prove)
+        data = build_params(('hash', tx_hash), ('prove', prove))
 
         await self._conn.send_rpc_message('tx', data)
     get_tx.__doc__ = HttpRpcClient.get_tx.__doc__
 
     async def tx_search(self, query: str, prove: Optional[bool] = None,
                         page: Optional[int] = None, limit: Optional[int] = None):
-        data = {
-            'query': query
-        }
-        if prove:
-            data['prove'] = str(prove)
-        if page:
-            data['page'] = str(page)
-        if limit:
-            data['limit'] = str(limit)
+        data = build_params(('query', query), ('prove', prove), ('page', page), ('limit', limit))
 
         await self._conn.send_rpc_message('tx_search', data)
     tx_search.__doc__ = HttpRpcClient.tx_search.__doc__
+
+
+for _name, _path, _doc in _PARAMLESS_METHODS:
+    setattr(WebsocketRpcClient, _name, _make_paramless_method(_name, _path, _doc))
@@ -1,11 +1,17 @@
+import base64
+import time
 import ujson
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Optional, Dict, List
 
 import asyncio
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import binance_chain.messages
+from binance_chain.utils import json_utils
 from binance_chain.exceptions import (
     BinanceChainAPIException, BinanceChainRequestException,
     BinanceChainSigningAuthenticationException
@@ -15,8 +21,19 @@ from binance_chain.exceptions import (
 requests.models.json = ujson
 
 
+JSON_HEADERS = MappingProxyType({'Content-Type': 'application/json'})
+
+
 class BaseApiSigningClient:
 
+    MAX_CONNECTIONS = 20
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.1
+    RETRY_STATUS_CODES = (502, 503, 504)
+    AUTH_PATH = 'auth/login'
+    # log in again this many seconds before the token expires
+    TOKEN_EXPIRY_MARGIN = 30
+
     def __init__(self, endpoint: str, username: str, password: str, requests_params: Optional[Dict] = None):
         """Binance Chain Signing API Client constructor
 
@@ -28,7 +45,11 @@ class BaseApiSigningClient:
         """
 
         self._token = None
+        self._token_expires_at: Optional[float] = None
+        self._auth_headers: Optional[Dict] = None
+        self._auth_json_headers: Optional[Dict] = None
         self._endpoint = endpoint
+        self._uris: Dict[str, str] = {}
         self._username = username
         self._password = password
         self._headers = {
@@ -42,15 +63,53 @@ class BaseApiSigningClient:
 
         session = requests.session()
         session.headers.update(self._headers)
+        session.headers['Connection'] = 'keep-alive'
+
+        # sign, broadcast and wallet calls all go to the one service, keep those connections pooled
+        # connection failures are always retried, gateway errors only for GET so a broadcast is never sent twice
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MAX_CONNECTIONS, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
         return session
 
     def _create_uri(self, path):
-        return f'{self._endpoint}/api/{path}'
+        try:
+            return self._uris[path]
+        except KeyError:
+            return self._uris.setdefault(path, f'{self._endpoint}/api/{path}')
 
     def authenticate(self):
         raise NotImplementedError()
 
-    def _get_request_kwargs(self, method, **kwargs):
+    def _set_token(self, token: Optional[str]):
+        # headers are built once per token and shared by every request, they must not be modified
+        self._token = token
+        self._token_expires_at = self._get_token_expiry(token) if token else None
+        self._auth_headers = {'Authorization': f'Bearer {token}'} if token else None
+        self._auth_json_headers = {**self._auth_headers, **JSON_HEADERS} if token else None
+
+    @staticmethod
+    def _get_token_expiry(token: str) -> Optional[float]:
+        """Read the exp claim from a JWT, the signature isn't checked as the service verifies the token
+
+        """
+        try:
+            payload = token.split('.')[1]
+            exp = json_utils.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4))).get('exp')
+        except (IndexError, ValueError, AttributeError):
+            return None
+        return float(exp) if isinstance(exp, (int, float)) else None
+
+    def _token_expired(self) -> bool:
+        return self._token_expires_at is not None and time.time() >= self._token_expires_at - self.TOKEN_EXPIRY_MARGIN
+
+    def _get_request_kwargs(self, method, authorised: bool = True, **kwargs):
 
         # set default requests timeout
         kwargs['timeout'] = 10
@@ -59,13 +118,22 @@ class BaseApiSigningClient:
         if self._requests_params:
             kwargs.update(self._requests_params)
 
-        if self._token:
-            kwargs['headers'] = {
-                'Authorization': f'Bearer {self._token}'
-            }
+        # send the body pre-serialised rather than letting the http library encode it
+        if 'json' in kwargs:
+            kwargs['data'] = json_utils.dumps_decimal(kwargs.pop('json'))
+
+        if self._token and authorised:
+            kwargs['headers'] = self._auth_json_headers if 'data' in kwargs else self._auth_headers
+        elif 'data' in kwargs:
+            kwargs['headers'] = JSON_HEADERS
 
         return kwargs
 
+    @staticmethod
+    def _get_msg_data(msg: binance_chain.messages.Msg, wallet_name: str) -> bytes:
+        # the msg is encoded once and reused, e.g. when signing then broadcasting the same message
+        return b'{"msg":%s,"wallet_name":%s}' % (msg.to_sign_json(), json_utils.dumps(wallet_name))
+
 
 class HttpApiSigningClient(BaseApiSigningClient):
 
@@ -83,13 +151,33 @@ class HttpApiSigningClient(BaseApiSigningClient):
 
         self.authenticate()
 
+    def close(self):
+        """Close the underlying session and any pooled connections
+
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def _request(self, method, path, **kwargs):
 
         uri = self._create_uri(path)
+        authorised = path != self.AUTH_PATH
+
+        if authorised and self._token_expired():
+            self.authenticate()
 
-        kwargs = self._get_request_kwargs(method, **kwargs)
+        response = getattr(self.session, method)(uri, **self._get_request_kwargs(method, authorised, **kwargs))
+
+        # the token may have been revoked or expired without an exp claim, log in again and retry once
+        if response.status_code == 401 and authorised:
+            self.authenticate()
+            response = getattr(self.session, method)(uri, **self._get_request_kwargs(method, authorised, **kwargs))
 
-        response = getattr(self.session, method)(uri, **kwargs)
         return self._handle_response(response)
 
     @staticmethod
@@ -100,10 +188,10 @@ class HttpApiSigningClient(BaseApiSigningClient):
 
         """
 
-        if not str(response.status_code).startswith('2'):
+        if not 200 <= response.status_code < 300:
             raise BinanceChainAPIException(response, response.status_code)
         try:
-            res = response.json()
+            res = json_utils.loads(response.content)
 
             if 'code' in res and res['code'] != "200000":
                 raise BinanceChainAPIException(response, response.status_code)
@@ -121,18 +209,23 @@ class HttpApiSigningClient(BaseApiSigningClient):
     def _post(self, path, **kwargs):
         return self._request('post', path, **kwargs)
 
+    def _post_msg(self, path, msg: binance_chain.messages.Msg, wallet_name: str):
+        return self._post(path, data=self._get_msg_data(msg, wallet_name))
+
     def authenticate(self):
         data = {
             "username": self._username,
             "password": self._password
         }
-        res = self._post("auth/login", json=data)
+        res = self._post(self.AUTH_PATH, json=data)
 
-        self._token = res.get('access_token')
-
-        if not self._token:
+        token = res.get('access_token')
+        if not token:
             raise BinanceChainSigningAuthenticationException("Invalid username and password")
 
+        # the old token stays in use until it is replaced
+        self._set_token(token)
+
     def sign_order(self, msg: binance_chain.messages.NewOrderMsg, wallet_name: str):
         """Sign a message using a signing service
 
@@ -157,11 +250,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('order/sign', json=data)
+        return self._post_msg('order/sign', msg, wallet_name)
 
     def broadcast_order(self, msg: binance_chain.messages.NewOrderMsg, wallet_name: str):
         """Sign and broadcast a message using a signing service
@@ -187,11 +276,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('order/broadcast', json=data)
+        return self._post_msg('order/broadcast', msg, wallet_name)
 
     def sign_cancel_order(self, msg: binance_chain.messages.CancelOrderMsg, wallet_name: str):
         """Sign a message using a signing service
@@ -211,11 +296,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('order/cancel/sign', json=data)
+        return self._post_msg('order/cancel/sign', msg, wallet_name)
 
     def broadcast_cancel_order(self, msg: binance_chain.messages.CancelOrderMsg, wallet_name: str):
         """Sign and broadcast a message using a signing service
@@ -235,11 +316,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('order/cancel/broadcast', json=data)
+        return self._post_msg('order/cancel/broadcast', msg, wallet_name)
 
     def sign_transfer(self, msg: binance_chain.messages.TransferMsg, wallet_name: str):
         """Sign a message using a signing service
@@ -259,11 +336,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('transfer/sign', json=data)
+        return self._post_msg('transfer/sign', msg, wallet_name)
 
     def broadcast_transfer(self, msg: binance_chain.messages.TransferMsg, wallet_name: str):
         """Sign and broadcast a message using a signing service
@@ -283,11 +356,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('transfer/broadcast', json=data)
+        return self._post_msg('transfer/broadcast', msg, wallet_name)
 
     def sign_freeze(self, msg: binance_chain.messages.FreezeMsg, wallet_name: str):
         """Sign a message using a signing service
@@ -306,11 +375,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('freeze/sign', json=data)
+        return self._post_msg('freeze/sign', msg, wallet_name)
 
     def broadcast_freeze(self, msg: binance_chain.messages.FreezeMsg, wallet_name: str):
         """Sign and broadcast a message using a signing service
@@ -329,11 +394,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('freeze/broadcast', json=data)
+        return self._post_msg('freeze/broadcast', msg, wallet_name)
 
     def sign_unfreeze(self, msg: binance_chain.messages.UnFreezeMsg, wallet_name: str):
         """Sign a message using a signing service
@@ -352,11 +413,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('unfreeze/sign', json=data)
+        return self._post_msg('unfreeze/sign', msg, wallet_name)
 
     def broadcast_unfreeze(self, msg: binance_chain.messages.UnFreezeMsg, wallet_name: str):
         """Sign and broadcast a message using a signing service
@@ -375,11 +432,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('unfreeze/broadcast', json=data)
+        return self._post_msg('unfreeze/broadcast', msg, wallet_name)
 
     def sign_vote(self, msg: binance_chain.messages.VoteMsg, wallet_name: str):
         """Sign a message using a signing service
@@ -398,11 +451,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('vote/sign', json=data)
+        return self._post_msg('vote/sign', msg, wallet_name)
 
     def broadcast_vote(self, msg: binance_chain.messages.VoteMsg, wallet_name: str):
         """Sign and broadcast a message using a signing service
@@ -421,11 +470,7 @@ class HttpApiSigningClient(BaseApiSigningClient):
         :return: API Response
 
         """
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return self._post('vote/broadcast', json=data)
+        return self._post_msg('vote/broadcast', msg, wallet_name)
 
     def wallet_resync(self, wallet_name: str):
         """Resynchronise the wallet to the chain
@@ -468,6 +513,10 @@ class HttpApiSigningClient(BaseApiSigningClient):
 
 class AsyncHttpApiSigningClient(BaseApiSigningClient):
 
+    MAX_CONNECTIONS = 100
+    KEEPALIVE_TIMEOUT = 60
+    DNS_CACHE_TTL = 300
+
     def __init__(self, endpoint: str, username: str, password: str,
                  loop: Optional[asyncio.AbstractEventLoop] = None,
                  requests_params: Optional[Dict] = None):
@@ -475,6 +524,8 @@ class AsyncHttpApiSigningClient(BaseApiSigningClient):
         super().__init__(endpoint, username, password, requests_params=requests_params)
 
         self._loop = loop
+        # held while logging in so concurrent requests share a single login
+        self._auth_lock = asyncio.Lock()
 
     @classmethod
     async def create(cls,
@@ -487,31 +538,66 @@ class AsyncHttpApiSigningClient(BaseApiSigningClient):
     def _init_session(self, **kwargs):
 
         loop = kwargs.get('loop', asyncio.get_event_loop())
+        # concurrent calls share keep-alive connections to the service
+        connector = aiohttp.TCPConnector(
+            loop=loop,
+            limit=self.MAX_CONNECTIONS,
+            keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=self.DNS_CACHE_TTL
+        )
         session = aiohttp.ClientSession(
             loop=loop,
+            connector=connector,
             headers=self._headers,
             json_serialize=ujson.dumps
         )
         return session
 
+    async def close(self):
+        """Close the underlying session and any pooled connections
+
+        """
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
     async def _request(self, method, path, **kwargs):
 
         uri = self._create_uri(path)
+        authorised = path != self.AUTH_PATH
+
+        if authorised and self._token_expired():
+            await self._refresh_token(self._token)
 
-        kwargs = self._get_request_kwargs(method, **kwargs)
+        token = self._token
+        async with getattr(self.session, method)(uri, **self._get_request_kwargs(method, authorised, **kwargs)) as response:
+            if response.status != 401 or not authorised:
+                return await self._handle_response(response)
 
-        async with getattr(self.session, method)(uri, **kwargs) as response:
+        # the token may have been revoked or expired without an exp claim, log in again and retry once
+        await self._refresh_token(token)
+        async with getattr(self.session, method)(uri, **self._get_request_kwargs(method, authorised, **kwargs)) as response:
             return await self._handle_response(response)
 
+    async def _refresh_token(self, token: Optional[str]):
+        async with self._auth_lock:
+            # another request may have logged in while this one waited
+            if self._token == token:
+                await self.authenticate()
+
     async def _handle_response(self, response):
         """Internal helper for handling API responses from the Binance server.
         Raises the appropriate exceptions when necessary; otherwise, returns the
         response.
         """
-        if not str(response.status).startswith('2'):
+        if not 200 <= response.status < 300:
             raise BinanceChainAPIException(response, response.status)
         try:
-            res = await response.json()
+            res = json_utils.loads(await response.read())
 
             if 'code' in res and res['code'] != "200000":
                 raise BinanceChainAPIException(response, response.status)
@@ -533,112 +619,69 @@ class AsyncHttpApiSigningClient(BaseApiSigningClient):
     async def _post(self, path, **kwargs):
         return await self._request('post', path, **kwargs)
 
+    async def _post_msg(self, path, msg: binance_chain.messages.Msg, wallet_name: str):
+        return await self._post(path, data=self._get_msg_data(msg, wallet_name))
+
     async def authenticate(self):
         data = {
             "username": self._username,
             "password": self._password
         }
-        res = await self._post("auth/login", json=data)
-
-        self._token = res.get('access_token')
+        res = await self._post(self.AUTH_PATH, json=data)
 
-        if not self._token:
+        token = res.get('access_token')
+        if not token:
             raise BinanceChainSigningAuthenticationException("Invalid username and password")
 
+        # the old token stays in use until it is replaced, requests already sent keep their header
+        self._set_token(token)
+
     async def sign_order(self, msg: binance_chain.messages.NewOrderMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('order/sign', json=data)
+        return await self._post_msg('order/sign', msg, wallet_name)
     sign_order.__doc__ = HttpApiSigningClient.sign_order.__doc__
 
     async def broadcast_order(self, msg: binance_chain.messages.NewOrderMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('order/broadcast', json=data)
+        return await self._post_msg('order/broadcast', msg, wallet_name)
     broadcast_order.__doc__ = HttpApiSigningClient.broadcast_order.__doc__
 
     async def sign_cancel_order(self, msg: binance_chain.messages.CancelOrderMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('order/cancel/sign', json=data)
+        return await self._post_msg('order/cancel/sign', msg, wallet_name)
     sign_cancel_order.__doc__ = HttpApiSigningClient.sign_cancel_order.__doc__
 
     async def broadcast_cancel_order(self, msg: binance_chain.messages.CancelOrderMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('order/cancel/broadcast', json=data)
+        return await self._post_msg('order/cancel/broadcast', msg, wallet_name)
     broadcast_cancel_order.__doc__ = HttpApiSigningClient.broadcast_cancel_order.__doc__
 
     async def sign_transfer(self, msg: binance_chain.messages.TransferMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('transfer/sign', json=data)
+        return await self._post_msg('transfer/sign', msg, wallet_name)
     sign_transfer.__doc__ = HttpApiSigningClient.sign_transfer.__doc__
 
     async def broadcast_transfer(self, msg: binance_chain.messages.TransferMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('transfer/broadcast', json=data)
+        return await self._post_msg('transfer/broadcast', msg, wallet_name)
     broadcast_transfer.__doc__ = HttpApiSigningClient.broadcast_transfer.__doc__
 
     async def sign_freeze(self, msg: binance_chain.messages.FreezeMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('freeze/sign', json=data)
+        return await self._post_msg('freeze/sign', msg, wallet_name)
     sign_freeze.__doc__ = HttpApiSigningClient.sign_freeze.__doc__
 
     async def broadcast_freeze(self, msg: binance_chain.messages.FreezeMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('freeze/broadcast', json=data)
+        return await self._post_msg('freeze/broadcast', msg, wallet_name)
     broadcast_freeze.__doc__ = HttpApiSigningClient.broadcast_freeze.__doc__
 
     async def sign_unfreeze(self, msg: binance_chain.messages.UnFreezeMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('unfreeze/sign', json=data)
+        return await self._post_msg('unfreeze/sign', msg, wallet_name)
     sign_unfreeze.__doc__ = HttpApiSigningClient.sign_unfreeze.__doc__
 
     async def broadcast_unfreeze(self, msg: binance_chain.messages.UnFreezeMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('unfreeze/broadcast', json=data)
+        return await self._post_msg('unfreeze/broadcast', msg, wallet_name)
     broadcast_unfreeze.__doc__ = HttpApiSigningClient.broadcast_unfreeze.__doc__
 
     async def sign_vote(self, msg: binance_chain.messages.VoteMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('vote/sign', json=data)
+        return await self._post_msg('vote/sign', msg, wallet_name)
     sign_vote.__doc__ = HttpApiSigningClient.sign_vote.__doc__
 
     async def broadcast_vote(self, msg: binance_chain.messages.VoteMsg, wallet_name: str):
-        data = {
-            'msg': msg.to_sign_dict(),
-            'wallet_name': wallet_name
-        }
-        return await self._post('vote/broadcast', json=data)
+        return await self._post_msg('vote/broadcast', msg, wallet_name)
     broadcast_vote.__doc__ = HttpApiSigningClient.broadcast_vote.__doc__
 
     async def wallet_resync(self, wallet_name: str):
@@ -654,3 +697,54 @@ class AsyncHttpApiSigningClient(BaseApiSigningClient):
             req_path = f'wallet/{wallet_name}'
         return await self._get(req_path)
     wallet_info.__doc__ = HttpApiSigningClient.wallet_info.__doc__
+
+    async def _post_msgs(self, path: str, msgs: List[binance_chain.messages.Msg], wallet_name: str) -> List:
+        # requests are sent concurrently over the session's pooled connections
+        return await asyncio.gather(*[self._post_msg(path, msg, wallet_name) for msg in msgs], return_exceptions=True)
+
+    async def sign_orders(self, msgs: List[binance_chain.messages.NewOrderMsg], wallet_name: str) -> List:
+        """Sign multiple orders concurrently using a signing service
+
+        :param msgs: list of NewOrderMsg
+        :param wallet_name: Name of the wallet
+
+        .. code:: python
+
+            res = await client.sign_orders([buy_order_msg, sell_order_msg], wallet_name='mywallet')
+
+        :return: list of API Responses in the same order as the messages, failed requests return their exception
+
+        """
+        return await self._post_msgs('order/sign', msgs, wallet_name)
+
+    async def broadcast_orders(self, msgs: List[binance_chain.messages.NewOrderMsg], wallet_name: str) -> List:
+        """Sign and broadcast multiple orders concurrently using a signing service
+
+        Reuse one client so the requests share its connection pool.
+
+        :param msgs: list of NewOrderMsg
+        :param wallet_name: Name of the wallet
+
+        .. code:: python
+
+            res = await client.broadcast_orders([buy_order_msg, sell_order_msg], wallet_name='mywallet')
+
+        :return: list of API Responses in the same order as the messages, failed requests return their exception
+
+        """
+        return await self._post_msgs('order/broadcast', msgs, wallet_name)
+
+    async def broadcast_transfers(self, msgs: List[binance_chain.messages.TransferMsg], wallet_name: str) -> List:
+        """Sign and broadcast multiple transfers concurrently using a signing service
+
+        :param msgs: list of TransferMsg
+        :param wallet_name: Name of the wallet
+
+        .. code:: python
+
+            res = await client.broadcast_transfers([transfer_msg, other_transfer_msg], wallet_name='mywallet')
+
+        :return: list of API Responses in the same order as the messages, failed requests return their exception
+
+        """
+        return await self._post_msgs('transfer/broadcast', msgs, wallet_name)
@@ -0,0 +1,30 @@
+import httpx
+
+from binance_chain.signing.http import HttpApiSigningClient
+
+
+class Http2ApiSigningClient(HttpApiSigningClient):
+    """Signing service client using HTTP/2 via httpx
+
+    Sign, broadcast and wallet requests are multiplexed over a single connection to the service.
+
+    .. code:: python
+
+        from binance_chain.signing.http2 import Http2ApiSigningClient
+
+        signing_client = Http2ApiSigningClient('https://localhost:8000', username='sam', password='mypass')
+
+    """
+
+    def _init_session(self):
+
+        limits = httpx.Limits(max_connections=self.MAX_CONNECTIONS, max_keepalive_connections=self.MAX_CONNECTIONS)
+        return httpx.Client(http2=True, limits=limits, headers=self._headers)
+
+    def _get_request_kwargs(self, method, authorised: bool = True, **kwargs):
+
+        kwargs = super()._get_request_kwargs(method, authorised, **kwargs)
+        # httpx takes a raw body as content
+        if 'data' in kwargs:
+            kwargs['content'] = kwargs.pop('data')
+        return kwargs
@@ -3,14 +3,20 @@ from decimal import Decimal
 from typing import Union
 
 
+_DECIMAL_1E8 = Decimal(10) ** 8
+
+# varints below 0x80 are the value as a single byte
+_SINGLE_BYTE_VARINTS = tuple(bytes((i, )) for i in range(0x80))
+
+
 def encode_number(num: Union[float, Decimal]) -> int:
     """Encode number multiply by 1e8 (10^8) and round to int
 
     :param num: number to encode
 
     """
-    if type(num) == Decimal:
-        return int(num * (Decimal(10) ** 8))
+    if isinstance(num, Decimal):
+        return int(num * _DECIMAL_1E8)
     else:
         return int(round(num * 1e8))
 
@@ -21,13 +27,17 @@ def varint_encode(num):
     :param num: number to encode
 
     """
-    buf = b''
+    # most encoded values are small lengths and field values
+    if num < 0x80:
+        return _SINGLE_BYTE_VARINTS[num]
+    if num < 0x4000:
+        return bytes(((num & 0x7f) | 0x80, num >> 7))
+    buf = bytearray()
     while True:
         towrite = num & 0x7f
         num >>= 7
         if num:
-            buf += bytes(((towrite | 0x80), ))
+            buf.append(towrite | 0x80)
         else:
-            buf += bytes((towrite, ))
-            break
-    return buf
+            buf.append(towrite)
+            return bytes(buf)
@@ -0,0 +1,56 @@
+"""JSON helpers using orjson when it is installed, falling back to ujson
+
+Both raise a ValueError subclass on invalid JSON and serialise to the same compact UTF-8 output.
+
+"""
+from decimal import Decimal
+
+import ujson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None
+
+
+# parse JSON from bytes or str
+loads = orjson.loads if orjson else ujson.loads
+
+
+def loads_lazy(data):
+    """Parse JSON from bytes with pysimdjson when it is installed, returning read-only dict and list like proxies
+    that only build python objects for the values accessed. Falls back to `loads`.
+
+    """
+    if simdjson is None:
+        return loads(data)
+    # a parser can't be reused while documents from it are alive
+    return simdjson.Parser().parse(data)
+
+
+def _ujson_dumps(obj) -> bytes:
+    return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+
+
+# serialise to compact JSON bytes
+dumps = orjson.dumps if orjson else _ujson_dumps
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+def dumps_decimal(obj) -> bytes:
+    """Serialise like `dumps`, also encoding Decimal values as numbers as ujson does
+
+    """
+    if orjson:
+        return orjson.dumps(obj, default=_default)
+    return _ujson_dumps(obj)
@@ -26,14 +26,14 @@ From https://github.com/sipa/bech32
 
 import array
 import hashlib
+from functools import lru_cache
 
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 
 
-def bech32_polymod(values):
-    """Internal function that computes the Bech32 checksum."""
+def bech32_polymod(values, chk=1):
+    """Internal function that computes the Bech32 checksum, optionally continuing from a previous state."""
     generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-    chk = 1
     for value in values:
         top = chk >> 25
         chk = (chk & 0x1ffffff) << 5 ^ value
@@ -47,15 +47,20 @@ def bech32_hrp_expand(hrp):
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+@lru_cache(maxsize=8)
+def _hrp_polymod(hrp):
+    """Checksum state after the expanded HRP, there are only a couple of HRPs in use."""
+    return bech32_polymod(bech32_hrp_expand(hrp))
+
+
 def bech32_verify_checksum(hrp, data):
     """Verify a checksum given HRP and converted data characters."""
-    return bech32_polymod(bech32_hrp_expand(hrp) + data) == 1
+    return bech32_polymod(data, _hrp_polymod(hrp)) == 1
 
 
 def bech32_create_checksum(hrp, data):
     """Compute the checksum values given HRP and data."""
-    values = bech32_hrp_expand(hrp) + data
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
+    polymod = bech32_polymod(data + [0, 0, 0, 0, 0, 0], _hrp_polymod(hrp)) ^ 1
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
 
@@ -1,14 +1,65 @@
 import binascii
+import hashlib
+import hmac
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, List, Iterable, Tuple
 
 from secp256k1 import PrivateKey
-from mnemonic import Mnemonic
-from pycoin.symbols.btc import network
 
 from binance_chain.utils.segwit_addr import address_from_public_key, decode_address
 from binance_chain.environment import BinanceEnvironment
 
+# secp256k1 0.13 builds a new context (with its precomputed tables) for every key unless one is passed in,
+# newer releases share a module level context and have no ctx argument
+_SECP256K1_CTX = getattr(PrivateKey(), 'ctx', None)
+_PRIVATE_KEY_KWARGS = {'ctx': _SECP256K1_CTX} if _SECP256K1_CTX is not None else {}
+
+_SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+_BIP32_HARDENED = 0x80000000
+
+
+def _parse_hd_path(path: str) -> Tuple[int, ...]:
+    return tuple(int(i[:-1]) + _BIP32_HARDENED if i.endswith("'") else int(i) for i in path.split('/'))
+
+
+def _bip32_master_key(seed: bytes) -> Tuple[bytes, bytes]:
+    digest = hmac.new(b'Bitcoin seed', seed, hashlib.sha512).digest()
+    return digest[:32], digest[32:]
+
+
+def _bip32_child_key(key: bytes, chain_code: bytes, index: int) -> Tuple[bytes, bytes]:
+    if index & _BIP32_HARDENED:
+        data = b'\x00' + key
+    else:
+        data = PrivateKey(key, **_PRIVATE_KEY_KWARGS).pubkey.serialize(compressed=True)
+    digest = hmac.new(chain_code, data + index.to_bytes(4, 'big'), hashlib.sha512).digest()
+
+    tweak = int.from_bytes(digest[:32], 'big')
+    child_key = (tweak + int.from_bytes(key, 'big')) % _SECP256K1_ORDER
+    if tweak >= _SECP256K1_ORDER or not child_key:
+        # probability is below 1 in 2**127, BIP32 says to use the next index
+        raise ValueError(f"Invalid child key for index {index}, use the next one")
+    return child_key.to_bytes(32, 'big'), digest[32:]
+
+
+@lru_cache(maxsize=None)
+def _get_mnemonic(language: str):
+    # imported here as it is only needed to create mnemonics, instances are cached as they load the wordlist
+    from mnemonic import Mnemonic
+
+    return Mnemonic(language)
+
+
+def _derive_bip32(key: bytes, chain_code: bytes, path: Iterable[int]) -> Tuple[bytes, bytes]:
+    """Derive a BIP32 private key and chain code along path, hashing with hashlib and using libsecp256k1 for the
+    public keys of non hardened steps
+
+    """
+    for index in path:
+        key, chain_code = _bip32_child_key(key, chain_code, index)
+    return key, chain_code
+
 
 class MnemonicLanguage(str, Enum):
     ENGLISH = 'english'
@@ -29,13 +80,17 @@ class BaseWallet:
         self._env = env or BinanceEnvironment.get_production_env()
         self._public_key = None
         self._address = None
+        self._address_decoded = None
+        self._public_key_hex = None
+        self._order_id_prefix = None
         self._account_number = None
         self._sequence = None
         self._chain_id = None
         self._http_client = None
 
     def initialise_wallet(self):
-        if self._account_number:
+        # account number 0 is valid, only skip once the account has been loaded
+        if self._account_number is not None:
             return
         account = self._get_http_client().get_account(self._address)
 
@@ -46,11 +101,12 @@ class BaseWallet:
         self._chain_id = node_info['node_info']['network']
 
     def increment_account_sequence(self):
-        if self._sequence:
+        # a new account starts at sequence 0
+        if self._sequence is not None:
             self._sequence += 1
 
     def decrement_account_sequence(self):
-        if self._sequence:
+        if self._sequence is not None:
             self._sequence -= 1
 
     def reload_account_sequence(self):
@@ -58,7 +114,10 @@ class BaseWallet:
         self._sequence = sequence_res['sequence']
 
     def generate_order_id(self):
-        return f"{binascii.hexlify(self.address_decoded).decode().upper()}-{(self._sequence + 1)}"
+        # the address part is fixed for the wallet, only the sequence changes per order
+        if self._order_id_prefix is None:
+            self._order_id_prefix = f"{binascii.hexlify(self.address_decoded).decode().upper()}-"
+        return f"{self._order_id_prefix}{self._sequence + 1}"
 
     def _get_http_client(self):
         if not self._http_client:
@@ -76,7 +135,7 @@ class BaseWallet:
 
     @property
     def address_decoded(self):
-        return decode_address(self._address)
+        return self._address_decoded
 
     @property
     def public_key(self):
@@ -84,7 +143,9 @@ class BaseWallet:
 
     @property
     def public_key_hex(self):
-        return binascii.hexlify(self._public_key)
+        if self._public_key_hex is None:
+            self._public_key_hex = binascii.hexlify(self._public_key)
+        return self._public_key_hex
 
     @property
     def account_number(self):
@@ -101,6 +162,14 @@ class BaseWallet:
     def sign_message(self, msg_bytes):
         raise NotImplementedError
 
+    def sign_messages_batch(self, msgs: List[bytes]):
+        """Sign several messages' sign bytes, returns the signatures in the same order
+
+        Public API for callers signing their own payloads, the clients sign each tx with sign_message
+
+        """
+        return [self.sign_message(msg_bytes) for msg_bytes in msgs]
+
 
 class Wallet(BaseWallet):
     """
@@ -115,16 +184,22 @@ class Wallet(BaseWallet):
     wallet2 = Wallet.create_wallet_from_mnemonic(m, passphrase=p, child=1, env=testnet_env)
     ...
 
+    # or derive several children at once
+    wallets = Wallet.create_wallets_from_mnemonic(m, passphrase=p, children=range(5), env=testnet_env)
+
     """
 
     HD_PATH = "44'/714'/0'/0/{id}"
+    # HD_PATH without the child id, parsed once
+    _HD_PARENT_PATH = _parse_hd_path(HD_PATH.rsplit('/', 1)[0])
 
     def __init__(self, private_key, env: Optional[BinanceEnvironment] = None):
         super().__init__(env)
         self._private_key = private_key
-        self._pk = PrivateKey(bytes(bytearray.fromhex(self._private_key)))
+        self._pk = PrivateKey(bytes(bytearray.fromhex(self._private_key)), **_PRIVATE_KEY_KWARGS)
         self._public_key = self._pk.pubkey.serialize(compressed=True)
         self._address = address_from_public_key(self._public_key, self._env.hrp)
+        self._address_decoded = decode_address(self._address)
 
     @classmethod
     def create_random_wallet(cls, language: MnemonicLanguage = MnemonicLanguage.ENGLISH,
@@ -148,12 +223,45 @@ class Wallet(BaseWallet):
         if type(child) != int:
             raise TypeError("Child wallet id should be of type int")
 
+        return cls._create_child_wallet(cls._get_hd_parent_key(mnemonic, passphrase), child, env)
+
+    @classmethod
+    def create_wallets_from_mnemonic(cls, mnemonic: str,
+                                     passphrase: Optional[str] = '',
+                                     children: Iterable[int] = range(10),
+                                     env: Optional[BinanceEnvironment] = None) -> List['Wallet']:
+        """Create multiple child wallets from mnemonic and passphrase
+
+        The seed and parent key are only derived once, which is much quicker than calling
+        create_wallet_from_mnemonic for each child.
+
+        .. code:: python
+
+            wallets = Wallet.create_wallets_from_mnemonic(m, passphrase=p, children=range(5), env=testnet_env)
+
+        :return: list of initialised Wallets in the order of children
+        """
+        parent_key = cls._get_hd_parent_key(mnemonic, passphrase)
+        wallets = []
+        for child in children:
+            if not isinstance(child, int):
+                raise TypeError("Child wallet id should be of type int")
+            wallets.append(cls._create_child_wallet(parent_key, child, env))
+        return wallets
+
+    @classmethod
+    def _get_hd_parent_key(cls, mnemonic: str, passphrase: Optional[str] = '') -> Tuple[bytes, bytes]:
+        # imported here as it is only needed to derive keys
+        from mnemonic import Mnemonic
+
         seed = Mnemonic.to_seed(mnemonic, passphrase)
-        new_wallet = network.keys.bip32_seed(seed)
-        child_wallet = new_wallet.subkey_for_path(Wallet.HD_PATH)
-        # convert secret exponent (private key) int to hex
-        key_hex = format(child_wallet.secret_exponent(), 'x')
-        return cls(key_hex, env=env)
+        return _derive_bip32(*_bip32_master_key(seed), cls._HD_PARENT_PATH)
+
+    @classmethod
+    def _create_child_wallet(cls, parent_key: Tuple[bytes, bytes], child: int,
+                             env: Optional[BinanceEnvironment] = None):
+        key, _ = _bip32_child_key(*parent_key, child)
+        return cls(key.hex(), env=env)
 
     @classmethod
     def create_random_mnemonic(cls, language: MnemonicLanguage = MnemonicLanguage.ENGLISH):
@@ -161,9 +269,7 @@ class Wallet(BaseWallet):
 
         :return: str, mnemonic phrase
         """
-        m = Mnemonic(language.value)
-        phrase = m.generate()
-        return phrase
+        return _get_mnemonic(language.value).generate()
 
     @property
     def private_key(self):
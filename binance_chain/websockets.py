@@ -14,6 +14,8 @@ class ReconnectingWebsocket:
     MAX_RECONNECTS: int = 5
     MAX_RECONNECT_SECONDS: int = 60
     MIN_RECONNECT_WAIT = 0.1
+    MAX_SEND_RETRIES: int = 5
+    MIN_SEND_RETRY_WAIT = 0.25
     TIMEOUT: int = 10
     PROTOCOL_VERSION: str = '1.0.0'
 
@@ -27,6 +29,8 @@ class ReconnectingWebsocket:
         self._connect_id: int = None
         self._ping_timeout = 60
         self._socket: Optional[ws.client.WebSocketClientProtocol] = None
+        # the endpoint doesn't change between reconnects
+        self._ws_url: str = self._get_ws_endpoint_url()
 
         self._connect()
 
@@ -40,9 +44,9 @@ class ReconnectingWebsocket:
 
         keep_waiting: bool = True
 
-        logging.info(f"connecting to {self._get_ws_endpoint_url()}")
+        logging.info(f"connecting to {self._ws_url}")
         try:
-            async with ws.connect(self._get_ws_endpoint_url(), loop=self._loop) as socket:
+            async with ws.connect(self._ws_url, loop=self._loop) as socket:
                 self._on_connect(socket)
 
                 try:
@@ -100,14 +104,19 @@ class ReconnectingWebsocket:
         msg = {"method": "keepAlive"}
         await self._socket.send(json.dumps(msg, ensure_ascii=False))
 
-    async def send_message(self, msg, retry_count=0):
-        if not self._socket:
-            if retry_count < 5:
-                await asyncio.sleep(1)
-                await self.send_message(msg, retry_count + 1)
-            else:
-                logging.info("Unable to send, not connected")
-        else:
+    async def _wait_for_socket(self) -> bool:
+        # back off exponentially while waiting for a connection, returns False if still not connected
+        for attempt in range(self.MAX_SEND_RETRIES):
+            if self._socket:
+                return True
+            await asyncio.sleep(self.MIN_SEND_RETRY_WAIT * 2 ** attempt)
+        if self._socket:
+            return True
+        logging.info("Unable to send, not connected")
+        return False
+
+    async def send_message(self, msg):
+        if await self._wait_for_socket():
             await self._socket.send(json.dumps(msg, ensure_ascii=False))
 
     async def ping(self):
@@ -24,7 +24,7 @@ def find_version(*file_paths):
 def install_requires():
 
     requires = [
-        'pycoin>=0.90.20201031', 'requests>=2.21.0', 'websockets>=7.0', 'aiohttp>=3.5.4',
+        'requests>=2.21.0', 'urllib3>=1.26', 'websockets>=7.0', 'aiohttp>=3.5.4',
         'secp256k1>=0.13.2', 'protobuf>=3.6.1', 'mnemonic>=0.18', 'ujson>=1.35'
     ]
     return requires
@@ -42,6 +42,10 @@ setup(
     install_requires=install_requires(),
     extras_require={
         'ledger': ['btchip-python>=0.1.28', ],
+        'orjson': ['orjson>=2.6.0', ],
+        'http2': ['httpx[http2]>=0.18.0', ],
+        'simdjson': ['pysimdjson>=3.0.0', ],
+        'uvloop': ['uvloop>=0.14.0', ],
     },
     keywords='binance dex exchange rest api bitcoin ethereum btc eth bnb ledger',
     classifiers=[
@@ -0,0 +1,45 @@
+import mock
+import pytest
+
+pytest.importorskip('btchip')
+
+from binance_chain.ledger.client import LedgerApp  # noqa: E402
+from binance_chain.environment import BinanceEnvironment  # noqa: E402
+
+
+class TestLedgerApp:
+
+    R = bytes(range(0x80, 0xa0))
+    S = bytes(range(0x90, 0xb0))
+
+    @pytest.fixture
+    def app(self):
+        return LedgerApp(mock.Mock(), env=BinanceEnvironment.get_testnet_env())
+
+    @staticmethod
+    def _der(r: bytes, s: bytes) -> bytes:
+        body = b'\x02' + bytes([len(r)]) + r + b'\x02' + bytes([len(s)]) + s
+        return b'\x30' + bytes([len(body)]) + body
+
+    @pytest.mark.parametrize('r, s', [
+        (R, S),
+        (b'\x00' + R, S),
+        (R, b'\x00' + S),
+        (b'\x00' + R, b'\x00' + S),
+    ])
+    def test_sign_strips_der_padding(self, app, r, s):
+        # integers with the high bit set are 0x00 padded to 33 bytes in DER
+        app._dongle.exchange.return_value = self._der(r, s)
+
+        assert app.sign(b'msg') == self.R + self.S
+
+    def test_sign_ignores_bytes_after_signature(self, app):
+        app._dongle.exchange.return_value = self._der(self.R, b'\x00' + self.S) + b'\x01'
+
+        assert app.sign(b'msg') == self.R + self.S
+
+    def test_sign_invalid_header(self, app):
+        app._dongle.exchange.return_value = b'\x31' + self._der(self.R, self.S)[1:]
+
+        with pytest.raises(Exception):
+            app.sign(b'msg')
@@ -1,13 +1,23 @@
+import base64
+import binascii
 import itertools
 
 import pytest
+import mock
+import requests
+import requests_mock
+from aiohttp import web
+from aiohttp import test_utils
 
 from binance_chain.http import HttpApiClient
 from binance_chain.node_rpc.http import HttpRpcClient, AsyncHttpRpcClient
-from binance_chain.node_rpc.request import RpcRequest
+from binance_chain.node_rpc.request import RpcRequest, get_request_template, format_request, build_params
+from binance_chain.node_rpc.cache import RpcResponseCache
 from binance_chain.environment import BinanceEnvironment
 from binance_chain.wallet import Wallet
+from binance_chain.messages import TransferMsg
 from binance_chain.constants import PeerType
+from binance_chain.exceptions import BinanceChainRPCException, BinanceChainRequestException
 
 
 class TestHttpRpcClient:
@@ -103,3 +113,360 @@ class TestRpcRequest:
         req2 = RpcRequest("mymethod", 2, {'param1': 'this', 'otherparam': 'that'})
         assert str(req2) == \
                '{"jsonrpc":"2.0","method":"mymethod","params":{"param1":"this","otherparam":"that"},"id":2}'
+
+    def test_build_params(self):
+        assert build_params(('query', 'tx.height=5'), ('prove', True), ('page', 2), ('limit', None)) == {
+            'query': 'tx.height=5', 'prove': 'true', 'page': '2'
+        }
+        assert build_params(('height', None)) == {}
+
+    def test_request_template(self):
+        assert get_request_template("abci_info") % 3 == b'{"jsonrpc":"2.0","method":"abci_info","id":3}'
+        assert get_request_template("abci_info") % 3 == str(RpcRequest("abci_info", 3)).encode()
+
+    def test_format_request(self):
+        params = {'query': "tx.height=5 AND message.sender='é\"'", 'prove': 'true', 'page': '1'}
+
+        assert format_request('block', 2, {'height': '10'}) == (
+            b'{"jsonrpc":"2.0","method":"block","params":{"height":"10"},"id":2}'
+        )
+        assert format_request('tx_search', 4, params) == str(RpcRequest('tx_search', 4, params)).encode()
+
+
+class TestHttpRpcClientMocked:
+
+    endpoint_url = 'http://rpc-node:27147'
+
+    @pytest.fixture
+    def rpcclient(self):
+        HttpRpcClient.id_generator = itertools.count(1)
+        return HttpRpcClient(endpoint_url=self.endpoint_url)
+
+    def test_batch_request(self, rpcclient):
+        with requests_mock.mock() as m:
+            # responses may be returned in any order
+            m.post(self.endpoint_url, json=[
+                {'jsonrpc': '2.0', 'id': 2, 'result': {'height': '2'}},
+                {'jsonrpc': '2.0', 'id': 1, 'result': {'height': '1'}},
+            ])
+            res = rpcclient.batch_request([('block', {'height': '1'}), ('block', {'height': '2'})])
+
+            assert m.last_request.text == (
+                '[{"jsonrpc":"2.0","method":"block","params":{"height":"1"},"id":1},'
+                '{"jsonrpc":"2.0","method":"block","params":{"height":"2"},"id":2}]'
+            )
+
+        assert res == [{'height': '1'}, {'height': '2'}]
+
+    def test_batch_request_error(self, rpcclient):
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json=[
+                {'jsonrpc': '2.0', 'id': 1, 'result': {'height': '1'}},
+                {'jsonrpc': '2.0', 'id': 2, 'error': {'code': -32603, 'message': 'Internal error'}},
+            ])
+            with pytest.raises(BinanceChainRPCException) as exc_info:
+                rpcclient.batch_request([('block', {'height': '1'}), ('block', {'height': '2'})])
+
+        assert exc_info.value.code == -32603
+
+    def test_request_error(self, rpcclient):
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json={
+                'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32602, 'message': 'Invalid params'}
+            })
+            with pytest.raises(BinanceChainRPCException) as exc_info:
+                rpcclient.get_block(-1)
+
+        assert exc_info.value.code == -32602
+        assert exc_info.value.message == 'Invalid params'
+        assert exc_info.value.status_code == 200
+
+    def test_request_timeout(self):
+        rpcclient = HttpRpcClient(endpoint_url=self.endpoint_url, timeout=5)
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json={'jsonrpc': '2.0', 'id': 1, 'result': {}})
+            rpcclient.get_status()
+
+            assert m.last_request.timeout == (HttpRpcClient.CONNECT_TIMEOUT, 5)
+
+    def test_request_compression(self, rpcclient):
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json={'jsonrpc': '2.0', 'id': 1, 'result': {}})
+            rpcclient.get_status()
+
+            assert m.last_request.headers['Accept-Encoding'] == 'gzip, deflate'
+
+    def test_broadcast_not_retried(self, rpcclient):
+        broadcast_adapter = rpcclient.session.get_adapter(f"{self.endpoint_url}/broadcast_tx_sync")
+        request_adapter = rpcclient.session.get_adapter(self.endpoint_url)
+
+        assert broadcast_adapter.max_retries.total == 0
+        assert request_adapter.max_retries.total == HttpRpcClient.MAX_RETRIES
+
+    def test_context_manager_closes_session(self):
+        with HttpRpcClient(endpoint_url=self.endpoint_url) as rpcclient:
+            adapter = rpcclient.session.get_adapter(self.endpoint_url)
+            adapter.close = mock.Mock()
+
+        adapter.close.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_session(self):
+        async with await AsyncHttpRpcClient.create(endpoint_url=self.endpoint_url) as rpcclient:
+            assert not rpcclient.session.closed
+
+        assert rpcclient.session.closed
+
+    @pytest.fixture
+    def transfer_msgs(self):
+        wallet = Wallet(
+            private_key='3dcc267e1f7edca86e03f0963b2d0b7804552d3014caddcfc435a4d7bc240cf5',
+            env=BinanceEnvironment.get_testnet_env()
+        )
+        wallet._account_number = 23452
+        wallet._sequence = 2
+        return [
+            TransferMsg(wallet=wallet, symbol='BNB', to_address='tbnb10a6kkxlf823w9lwr6l9hzw4uyphcw7qzrud5rr', amount=1)
+            for _ in range(2)
+        ]
+
+    def test_broadcast_msg(self, rpcclient, transfer_msgs):
+        with requests_mock.mock() as m:
+            m.get(f"{self.endpoint_url}/broadcast_tx_sync", json={'jsonrpc': '2.0', 'id': '', 'result': {'code': 0}})
+            assert rpcclient.broadcast_msg(transfer_msgs[0]) == {'code': 0}
+            assert rpcclient.broadcast_msg(transfer_msgs[1]) == {'code': 0}
+
+            assert m.call_count == 2
+        assert rpcclient._path_urls == {'broadcast_tx_sync': f"{self.endpoint_url}/broadcast_tx_sync"}
+
+    def test_broadcast_msgs(self, rpcclient, transfer_msgs):
+        wallet = transfer_msgs[0].wallet
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json=[
+                {'jsonrpc': '2.0', 'id': 1, 'result': {'code': 0, 'hash': 'A'}},
+                {'jsonrpc': '2.0', 'id': 2, 'result': {'code': 0, 'hash': 'B'}},
+            ])
+            res = rpcclient.broadcast_msgs(transfer_msgs)
+
+            reqs = m.last_request.json()
+
+        assert [r['method'] for r in reqs] == ['broadcast_tx_sync', 'broadcast_tx_sync']
+        # each message is signed with the next sequence
+        wallet._sequence = 3
+        assert base64.b64decode(reqs[1]['params']['tx']) == binascii.unhexlify(transfer_msgs[1].to_hex_data())
+        assert [r['hash'] for r in res] == ['A', 'B']
+
+    def test_broadcast_msgs_new_account(self, rpcclient, transfer_msgs):
+        wallet = transfer_msgs[0].wallet
+        expected = []
+        for sequence, msg in enumerate(transfer_msgs):
+            wallet._sequence = sequence
+            expected.append(base64.b64encode(binascii.unhexlify(msg.to_hex_data())).decode())
+        wallet._sequence = 0
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json=[
+                {'jsonrpc': '2.0', 'id': 1, 'result': {'code': 0, 'hash': 'A'}},
+                {'jsonrpc': '2.0', 'id': 2, 'result': {'code': 0, 'hash': 'B'}},
+            ])
+            rpcclient.broadcast_msgs(transfer_msgs)
+
+            reqs = m.last_request.json()
+
+        assert [req['params']['tx'] for req in reqs] == expected
+        assert wallet.sequence == 2
+
+    def test_broadcast_msgs_signing_error_resets_sequence(self, rpcclient, transfer_msgs):
+        wallet = transfer_msgs[0].wallet
+        with mock.patch('binance_chain.node_rpc.http.StdTxMsg.to_amino', side_effect=[b'tx', ValueError('bad msg')]):
+            with pytest.raises(ValueError):
+                rpcclient.broadcast_msgs(transfer_msgs)
+
+        assert wallet.sequence == 2
+
+    def test_broadcast_msgs_error_resets_sequence(self, rpcclient, transfer_msgs):
+        wallet = transfer_msgs[0].wallet
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json={'jsonrpc': '2.0', 'id': -1, 'error': {'code': -32700, 'message': 'Parse'}})
+            with pytest.raises(BinanceChainRPCException):
+                rpcclient.broadcast_msgs(transfer_msgs)
+
+        assert wallet.sequence == 2
+
+    def test_broadcast_msgs_rejected_tx_resets_later_sequences(self, rpcclient, transfer_msgs):
+        wallet = transfer_msgs[0].wallet
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json=[
+                {'jsonrpc': '2.0', 'id': 1, 'result': {'code': 0, 'hash': 'A'}},
+                {'jsonrpc': '2.0', 'id': 2, 'error': {'code': -32603, 'message': 'tx already exists in cache'}},
+            ])
+            with pytest.raises(BinanceChainRPCException):
+                rpcclient.broadcast_msgs(transfer_msgs)
+
+        # the first transaction was accepted so keeps its sequence
+        assert wallet.sequence == 3
+        adapter = rpcclient._broadcast_session.get_adapter(self.endpoint_url)
+        assert adapter.max_retries.total == 0
+
+    def test_broadcast_msgs_failed_check_tx_resets_sequence(self, rpcclient, transfer_msgs):
+        wallet = transfer_msgs[0].wallet
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json=[
+                {'jsonrpc': '2.0', 'id': 1, 'result': {'code': 4, 'hash': 'A'}},
+                {'jsonrpc': '2.0', 'id': 2, 'result': {'code': 4, 'hash': 'B'}},
+            ])
+            res = rpcclient.broadcast_msgs(transfer_msgs)
+
+        assert [r['code'] for r in res] == [4, 4]
+        assert wallet.sequence == 2
+
+    def test_broadcast_msgs_no_response_reloads_sequence(self, rpcclient, transfer_msgs):
+        wallet = transfer_msgs[0].wallet
+        with requests_mock.mock() as m, mock.patch.object(wallet, 'reload_account_sequence') as reload:
+            m.post(self.endpoint_url, exc=requests.exceptions.ReadTimeout)
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                rpcclient.broadcast_msgs(transfer_msgs)
+
+        reload.assert_called_once()
+
+    def test_blockchain_info_invalid_range(self, rpcclient):
+        with pytest.raises(BinanceChainRequestException):
+            rpcclient.get_blockchain_info(1000, 1)
+
+    def test_iter_txs(self, rpcclient):
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, [
+                {'json': {'jsonrpc': '2.0', 'id': 1, 'result': {'txs': [{'hash': 'A'}, {'hash': 'B'}]}}},
+                {'json': {'jsonrpc': '2.0', 'id': 2, 'result': {'txs': [{'hash': 'C'}]}}},
+            ])
+            txs = [tx['hash'] for tx in rpcclient.iter_txs('tx.height=1', per_page=2)]
+
+            assert m.call_count == 2
+            assert m.last_request.json()['params'] == {'query': 'tx.height=1', 'page': '2', 'limit': '2'}
+
+        assert txs == ['A', 'B', 'C']
+
+
+class TestAsyncHttpRpcClientLocal:
+
+    @pytest.fixture
+    async def rpc_server(self):
+        async def handle(request):
+            reqs = await request.json()
+            if isinstance(reqs, list):
+                return web.json_response([
+                    {'jsonrpc': '2.0', 'id': req['id'], 'result': {'height': req['params']['height']}} for req in reqs
+                ])
+            return web.json_response({'jsonrpc': '2.0', 'id': reqs['id'], 'result': {'method': reqs['method']}})
+
+        app = web.Application()
+        app.router.add_post('/', handle)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        yield server
+        await server.close()
+
+    @pytest.mark.asyncio
+    async def test_request(self, rpc_server):
+        async with await AsyncHttpRpcClient.create(endpoint_url=str(rpc_server.make_url(''))) as rpcclient:
+            assert await rpcclient.get_status() == {'method': 'status'}
+
+    @pytest.mark.asyncio
+    async def test_batch_request(self, rpc_server):
+        async with await AsyncHttpRpcClient.create(endpoint_url=str(rpc_server.make_url(''))) as rpcclient:
+            res = await rpcclient.batch_request([('block', {'height': '1'}), ('block', {'height': '2'})])
+
+        assert res == [{'height': '1'}, {'height': '2'}]
+
+    @pytest.mark.asyncio
+    async def test_shared_connector(self, rpc_server):
+        connector = AsyncHttpRpcClient.create_connector(limit=10)
+        endpoint_url = str(rpc_server.make_url(''))
+
+        async with await AsyncHttpRpcClient.create(endpoint_url=endpoint_url, connector=connector) as rpcclient:
+            assert await rpcclient.get_status() == {'method': 'status'}
+
+        # closing a client leaves the shared connector open for the others
+        assert not connector.closed
+        async with await AsyncHttpRpcClient.create(endpoint_url=endpoint_url, connector=connector) as rpcclient:
+            assert await rpcclient.get_health() == {'method': 'health'}
+
+        await connector.close()
+
+
+class TestHttpRpcResponseCache:
+
+    endpoint_url = 'http://rpc-node:27147'
+
+    @pytest.fixture
+    def rpcclient(self):
+        return HttpRpcClient(endpoint_url=self.endpoint_url)
+
+    def test_block_at_height_cached(self, rpcclient):
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json={'jsonrpc': '2.0', 'id': 1, 'result': {'block': {}}})
+
+            assert rpcclient.get_block(10000) == {'block': {}}
+            assert rpcclient.get_block(10000) == {'block': {}}
+            assert m.call_count == 1
+
+            # latest block is never cached
+            rpcclient.get_block()
+            rpcclient.get_block()
+            assert m.call_count == 3
+
+    def test_get_blocks(self, rpcclient):
+        def batch_response(request, context):
+            reqs = request.json()
+            if isinstance(reqs, dict):
+                return {'jsonrpc': '2.0', 'id': reqs['id'], 'result': {'height': reqs['params']['height']}}
+            return [
+                {'jsonrpc': '2.0', 'id': req['id'], 'result': {'height': req['params']['height']}}
+                for req in reversed(reqs)
+            ]
+
+        rpcclient.BATCH_SIZE = 2
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json=batch_response)
+            rpcclient.get_block(3)
+
+            blocks = rpcclient.get_blocks([5, 1, 2, 3, 4, 1])
+
+            # block 3 came from the cache, the other 4 unique heights took 2 batches
+            assert m.call_count == 3
+
+        assert [b['height'] for b in blocks] == ['5', '1', '2', '3', '4', '1']
+
+    def test_immutable_responses_cached(self, rpcclient):
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json={'jsonrpc': '2.0', 'id': 1, 'result': {}})
+
+            rpcclient.get_genesis()
+            rpcclient.get_genesis()
+            rpcclient.get_consensus_params(100)
+            rpcclient.get_consensus_params(100)
+            assert m.call_count == 2
+
+            # latest consensus params may change
+            rpcclient.get_consensus_params()
+            rpcclient.get_consensus_params()
+            assert m.call_count == 4
+
+    def test_lazy_block_not_cached(self, rpcclient):
+        with requests_mock.mock() as m:
+            m.post(self.endpoint_url, json={'jsonrpc': '2.0', 'id': 1, 'result': {'block': {'header': {'height': '5'}}}})
+
+            assert rpcclient.get_block(5, lazy=True)['block']['header']['height'] == '5'
+            rpcclient.get_block(5, lazy=True)
+            assert m.call_count == 2
+
+    def test_lru_eviction(self):
+        cache = RpcResponseCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert cache.get('a') == 1
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert len(cache) == 2
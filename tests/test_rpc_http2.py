@@ -0,0 +1,46 @@
+import itertools
+
+import httpx
+import pytest
+
+from binance_chain.node_rpc.http2 import Http2RpcClient
+from binance_chain.exceptions import BinanceChainRPCException
+
+
+class TestHttp2RpcClient:
+
+    endpoint_url = 'http://rpc-node:27147'
+
+    def _get_client(self, response_json, requests=None, **kwargs):
+        def handler(request):
+            if requests is not None:
+                requests.append(request)
+            return httpx.Response(200, json=response_json)
+
+        Http2RpcClient.id_generator = itertools.count(1)
+        client = Http2RpcClient(endpoint_url=self.endpoint_url, **kwargs)
+        client.session = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_http2_session(self):
+        client = Http2RpcClient(endpoint_url=self.endpoint_url)
+
+        assert isinstance(client.session, httpx.Client)
+        assert client.session.headers['Accept-Encoding'] == 'gzip, deflate'
+
+    def test_request(self):
+        requests = []
+        client = self._get_client({'jsonrpc': '2.0', 'id': 1, 'result': {'node_info': {}}}, requests, timeout=5)
+
+        assert client.get_status() == {'node_info': {}}
+        assert requests[0].content == b'{"jsonrpc":"2.0","method":"status","id":1}'
+        assert requests[0].extensions['timeout']['read'] == 5
+        assert requests[0].extensions['timeout']['connect'] == Http2RpcClient.CONNECT_TIMEOUT
+
+    def test_request_error(self):
+        client = self._get_client({'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32602, 'message': 'Invalid params'}})
+
+        with pytest.raises(BinanceChainRPCException) as exc_info:
+            client.get_block(-1)
+
+        assert exc_info.value.code == -32602
@@ -1,7 +1,10 @@
+import mock
 import pytest
+from aiohttp import web, test_utils
 
 from binance_chain.node_rpc.pooled_client import PooledRpcClient
 from binance_chain.environment import BinanceEnvironment
+from binance_chain.exceptions import BinanceChainRequestException
 
 
 class TestRpcPooled:
@@ -20,3 +23,120 @@ class TestRpcPooled:
         await prc.get_consensus_state()
         await prc.get_blockchain_info(1, 1000)
         await prc.get_abci_info()
+
+
+class TestRpcPooledRequests:
+
+    @pytest.fixture
+    def clients(self):
+        return [mock.Mock(), mock.Mock()]
+
+    @pytest.fixture
+    def prc(self, clients):
+        prc = PooledRpcClient(env=BinanceEnvironment.get_testnet_env())
+        prc._set_clients(clients)
+        return prc
+
+    @pytest.mark.asyncio
+    async def test_request_forwards_params(self, prc, clients):
+        clients[0].get_tx = mock.AsyncMock(return_value={'hash': 'A'})
+
+        assert await prc.get_tx('A') == {'hash': 'A'}
+        clients[0].get_tx.assert_awaited_once_with(tx_hash='A', prove=None)
+
+    @pytest.mark.asyncio
+    async def test_request_round_robin(self, prc, clients):
+        for client in clients:
+            client.get_block = mock.AsyncMock()
+
+        await prc.get_block(1)
+        await prc.get_block(2)
+        await prc.get_block(3)
+
+        assert clients[0].get_block.await_args_list == [mock.call(height=1, lazy=False), mock.call(height=3, lazy=False)]
+        assert clients[1].get_block.await_args_list == [mock.call(height=2, lazy=False)]
+
+    @pytest.mark.asyncio
+    async def test_request_no_clients(self):
+        prc = PooledRpcClient(env=BinanceEnvironment.get_testnet_env())
+
+        with pytest.raises(BinanceChainRequestException):
+            await prc.get_status()
+
+    @pytest.mark.asyncio
+    async def test_gather(self, prc, clients):
+        clients[0].get_block = mock.AsyncMock(side_effect=lambda height: {'height': height})
+        clients[1].get_block = mock.AsyncMock(side_effect=BinanceChainRequestException('peer down'))
+
+        res = await prc.gather(('get_block', {'height': height}) for height in range(3))
+
+        assert res[0] == {'height': 0}
+        assert isinstance(res[1], BinanceChainRequestException)
+        assert res[2] == {'height': 2}
+
+    @pytest.mark.asyncio
+    async def test_peers_cached(self):
+        PooledRpcClient._peers_cache.clear()
+        api_client = mock.Mock()
+        api_client.get_node_peers = mock.AsyncMock(return_value=[{'listen_addr': 'http://a'}])
+        api_client.session.close = mock.AsyncMock()
+
+        with mock.patch('binance_chain.node_rpc.pooled_client.AsyncHttpApiClient.create',
+                        mock.AsyncMock(return_value=api_client)):
+            first = PooledRpcClient(env=BinanceEnvironment.get_testnet_env())
+            await first.initialise_clients()
+            second = PooledRpcClient(env=BinanceEnvironment.get_testnet_env())
+            await second.initialise_clients()
+
+        api_client.get_node_peers.assert_awaited_once()
+        assert second.num_peers == 1
+        await first.close()
+        await second.close()
+        PooledRpcClient._peers_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_refresh_peers_updates_delta(self, prc, clients):
+        PooledRpcClient._peers_cache.clear()
+        clients[0]._endpoint_url = 'http://a'
+        clients[1]._endpoint_url = 'http://b'
+        for client in clients:
+            client.close = mock.AsyncMock()
+        api_client = mock.Mock()
+        api_client.get_node_peers = mock.AsyncMock(return_value=[{'listen_addr': 'http://a'}, {'listen_addr': 'http://c'}])
+        api_client.session.close = mock.AsyncMock()
+
+        with mock.patch('binance_chain.node_rpc.pooled_client.AsyncHttpApiClient.create',
+                        mock.AsyncMock(return_value=api_client)):
+            await prc.refresh_peers()
+
+        urls = sorted(client._endpoint_url for client in prc._clients)
+        assert urls == ['http://a', 'http://c']
+        assert clients[0] in prc._clients
+        clients[1].close.assert_awaited_once()
+        await prc.close()
+        PooledRpcClient._peers_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_peers_share_response_cache(self):
+        requests = []
+
+        async def handle(request):
+            req = await request.json()
+            requests.append(req)
+            return web.json_response({'jsonrpc': '2.0', 'id': req['id'], 'result': {'height': req['params']['height']}})
+
+        app = web.Application()
+        app.router.add_post('/', handle)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+
+        prc = PooledRpcClient(env=BinanceEnvironment.get_testnet_env())
+        await prc._update_clients([
+            {'listen_addr': f'http://127.0.0.1:{server.port}'}, {'listen_addr': f'http://localhost:{server.port}'}
+        ])
+
+        assert await prc.get_block(5) == await prc.get_block(5) == {'height': '5'}
+        assert len(requests) == 1
+
+        await prc.close()
+        await server.close()
@@ -1,9 +1,14 @@
 import pytest
 import asyncio
+import mock
+import json
+from socket import IPPROTO_TCP, TCP_NODELAY
 
 from binance_chain.http import HttpApiClient
-from binance_chain.node_rpc.websockets import ReconnectingRpcWebsocket, WebsocketRpcClient
+from binance_chain.node_rpc.http import HttpRpcClient
+from binance_chain.node_rpc.websockets import ReconnectingRpcWebsocket, WebsocketRpcClient, _RpcConnectionView
 from binance_chain.environment import BinanceEnvironment
+from binance_chain.exceptions import BinanceChainRequestException
 
 
 class TestRpcWebsockets:
@@ -55,3 +60,378 @@ class TestRpcWebsockets:
         await wrc.tx_search("query", True, 1, 10)
         await wrc.get_blockchain_info(1, 1000)
         await wrc.abci_query("data_str", "path_str", True, 1000)
+
+
+class TestRpcWebsocketSubscriptions:
+
+    @pytest.fixture
+    def wrc(self):
+        wrc = WebsocketRpcClient(env=BinanceEnvironment.get_testnet_env())
+        wrc._conn = mock.Mock()
+        wrc._conn.send_rpc_message = mock.AsyncMock()
+        return wrc
+
+    @pytest.mark.asyncio
+    async def test_subscribe_new_block(self, wrc):
+        await wrc.subscribe_new_block()
+
+        wrc._conn.send_rpc_message.assert_awaited_once_with('subscribe', {'query': "tm.event = 'NewBlock'"})
+
+    @pytest.mark.asyncio
+    async def test_subscribe_tx(self, wrc):
+        await wrc.subscribe_tx()
+        await wrc.subscribe_tx("tx.height = 5")
+
+        assert wrc._conn.send_rpc_message.await_args_list == [
+            mock.call('subscribe', {'query': "tm.event = 'Tx'"}),
+            mock.call('subscribe', {'query': "tm.event = 'Tx' AND tx.height = 5"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_invalid_query(self, wrc):
+        await wrc.subscribe("tm.event = 'Tx' AND transfer.sender CONTAINS 'bnb1'")
+
+        for query in ["tm event = 'Tx'", "tx.height = 5 OR tx.height = 6", "tm.event = 'Tx"]:
+            with pytest.raises(BinanceChainRequestException):
+                await wrc.subscribe(query)
+
+        wrc._conn.send_rpc_message.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_paramless_methods(self, wrc):
+        await wrc.get_status()
+        await wrc.get_genesis()
+
+        assert wrc._conn.send_rpc_message.await_args_list == [mock.call('status'), mock.call('genesis')]
+        assert WebsocketRpcClient.get_status.__doc__ == HttpRpcClient.get_status.__doc__
+
+    @pytest.mark.asyncio
+    async def test_request_params(self, wrc):
+        await wrc.get_block()
+        await wrc.get_block(10)
+        await wrc.tx_search("tx.height = 5", prove=True, page=2)
+
+        assert wrc._conn.send_rpc_message.await_args_list == [
+            mock.call('block', {}),
+            mock.call('block', {'height': '10'}),
+            mock.call('tx_search', {'query': "tx.height = 5", 'prove': 'true', 'page': '2'}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_msg(self, wrc):
+        msg = mock.Mock()
+        msg.to_hex_data.return_value = b'abcd'
+
+        await wrc.broadcast_msg(msg)
+
+        msg.wallet.initialise_wallet.assert_called_once()
+        msg.wallet.increment_account_sequence.assert_called_once()
+        wrc._conn.send_rpc_message.assert_awaited_once_with('broadcast_tx_sync', {'tx': b'"0xabcd"'}, encoded=True)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_broadcasts_use_distinct_sequences(self, wrc):
+        wallet = mock.Mock(sequence=7)
+        wallet.increment_account_sequence.side_effect = lambda: setattr(wallet, 'sequence', wallet.sequence + 1)
+        msgs = [mock.Mock(wallet=wallet), mock.Mock(wallet=wallet)]
+        for msg in msgs:
+            msg.to_hex_data.side_effect = lambda: b'%d' % wallet.sequence
+
+        async def send_rpc_message(*args, **kwargs):
+            await asyncio.sleep(0)
+            return 1
+
+        # clients sharing a connection also share the wallet locks
+        other = WebsocketRpcClient(env=BinanceEnvironment.get_testnet_env())
+        other._conn = wrc._conn
+        wrc._conn.send_rpc_message.side_effect = send_rpc_message
+
+        await asyncio.gather(wrc.broadcast_msg(msgs[0]), other.broadcast_msg(msgs[1]))
+
+        sent = [c.args[1]['tx'] for c in wrc._conn.send_rpc_message.await_args_list]
+        assert sent == [b'"0x7"', b'"0x8"']
+        assert wallet.sequence == 9
+
+    @pytest.mark.asyncio
+    async def test_broadcast_msg_not_connected(self, wrc):
+        msg = mock.Mock()
+        msg.to_hex_data.return_value = b'abcd'
+        wrc._conn.send_rpc_message.return_value = None
+
+        assert await wrc.broadcast_msg(msg) is None
+
+        msg.wallet.increment_account_sequence.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_blockchain_info_invalid_range(self, wrc):
+        with pytest.raises(BinanceChainRequestException):
+            await wrc.get_blockchain_info(10, 10)
+
+        wrc._conn.send_rpc_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_recv_queues_callbacks(self, wrc):
+        wrc._callback = mock.AsyncMock(side_effect=[ValueError('bad message'), None])
+
+        await wrc._recv({'id': 1})
+        await wrc._recv({'id': 2})
+        await wrc._callback_queue.join()
+
+        assert wrc._callback.await_args_list == [mock.call({'id': 1}), mock.call({'id': 2})]
+        wrc._callback_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_recv_drops_when_queue_full(self, wrc):
+        stalled = asyncio.Event()
+
+        async def callback(msg):
+            await stalled.wait()
+
+        wrc._callback = mock.AsyncMock(side_effect=callback)
+        wrc.CALLBACK_QUEUE_SIZE = 1
+
+        with mock.patch.object(wrc, '_log') as log:
+            for event in range(3):
+                await asyncio.wait_for(wrc._recv({'id': '1#event', 'result': event}), 1)
+                await asyncio.sleep(0)
+
+        # the first event is with the stalled callback, the second waits and the third is dropped
+        log.warning.assert_called_once()
+        stalled.set()
+        await wrc._callback_queue.join()
+        assert [c.args[0]['result'] for c in wrc._callback.await_args_list] == [0, 1]
+        wrc._callback_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_recv_keeps_replies_when_queue_full(self, wrc):
+        stalled = asyncio.Event()
+
+        async def callback(msg):
+            await stalled.wait()
+
+        wrc._callback = mock.AsyncMock(side_effect=callback)
+        wrc.CALLBACK_QUEUE_SIZE = 1
+
+        for msg in ({'id': '1#event'}, {'id': '1#event'}, {'id': 2, 'result': {}}):
+            await asyncio.wait_for(wrc._recv(msg), 1)
+            await asyncio.sleep(0)
+
+        stalled.set()
+        await wrc._callback_queue.join()
+        assert wrc._callback.await_args_list[-1] == mock.call({'id': 2, 'result': {}})
+        wrc._callback_task.cancel()
+
+
+class TestRpcWebsocketMessages:
+
+    @pytest.fixture
+    def socket(self):
+        with mock.patch.object(ReconnectingRpcWebsocket, '_connect'):
+            socket = ReconnectingRpcWebsocket(None, None, env=BinanceEnvironment.get_testnet_env())
+        socket._conn = mock.Mock()
+        socket._socket = mock.Mock()
+        socket._socket.send = mock.AsyncMock()
+        return socket
+
+    @pytest.mark.asyncio
+    async def test_send_rpc_message(self, socket):
+        await socket.send_rpc_message('status')
+        await socket.send_rpc_message('block', {'height': '10'})
+        await socket.send_rpc_message('broadcast_tx_sync', {'tx': b'"0xabcd"'}, encoded=True)
+        await socket.flush()
+
+        status, block, tx = [json.loads(args[0]) for args, _ in socket._socket.send.await_args_list]
+        assert tx['params'] == {'tx': '0xabcd'}
+        assert status['method'] == 'status' and 'params' not in status
+        assert block['method'] == 'block' and block['params'] == {'height': '10'}
+        assert block['id'] > status['id']
+        await socket.cancel()
+
+    @pytest.mark.asyncio
+    async def test_send_rpc_message_not_connected(self, socket):
+        socket._socket = None
+
+        with mock.patch('asyncio.sleep', mock.AsyncMock()) as sleep:
+            await socket.send_rpc_message('status')
+
+        assert [args[0] for args, _ in sleep.await_args_list] == [0.25, 0.5, 1, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_send_rpc_messages_coalesced(self, socket):
+        await asyncio.gather(*[socket.send_rpc_message('status') for _ in range(3)])
+        await socket.flush()
+
+        assert socket._socket.send.await_count == 3
+        await socket.cancel()
+
+    def test_ws_url(self, socket):
+        assert socket._ws_url == f"{BinanceEnvironment.get_testnet_env().wss_url}/websocket"
+
+    def test_tune_socket(self, socket):
+        sock = mock.Mock()
+        socket._tune_socket(sock)
+
+        assert mock.call(IPPROTO_TCP, TCP_NODELAY, 1) in sock.setsockopt.call_args_list
+
+    @pytest.mark.asyncio
+    async def test_send_task_failure_logged(self, socket):
+        socket._get_rpc_message = mock.Mock(return_value=b'{}')
+        socket._send_queue = mock.Mock()
+        socket._send_queue.get = mock.AsyncMock(side_effect=RuntimeError('queue broken'))
+
+        with mock.patch.object(socket, '_log') as log:
+            await socket.send_rpc_message('status')
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        assert socket._send_task.done()
+        log.info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_routes_by_id(self, socket):
+        first, second = mock.AsyncMock(), mock.AsyncMock()
+        socket.add_consumer(first)
+        socket.add_consumer(second)
+
+        req_id = await socket.subscribe('q', first)
+        status_id = await socket.send_rpc_message('status', callback=second)
+
+        await socket._dispatch({'id': req_id, 'result': {}})
+        await socket._dispatch({'id': f'{req_id}#event', 'result': {'data': 1}})
+        await socket._dispatch({'id': status_id, 'result': {}})
+        await socket._dispatch({'id': status_id, 'result': {}})
+
+        assert first.await_count == 3
+        assert second.await_count == 2
+        await socket.cancel()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_subscription(self, socket):
+        first, second = mock.AsyncMock(), mock.AsyncMock()
+        first_view, second_view = _RpcConnectionView(socket, first), _RpcConnectionView(socket, second)
+        query = {'query': "tm.event = 'NewBlock'"}
+
+        await first_view.send_rpc_message('subscribe', query)
+        await second_view.send_rpc_message('subscribe', query)
+        await socket.flush()
+
+        # the node rejects a second subscription to the same query on a connection
+        assert socket._socket.send.await_count == 1
+        req_id = json.loads(socket._socket.send.await_args.args[0])['id']
+
+        await socket._dispatch({'id': f'{req_id}#event', 'result': {'data': 1}})
+        first.assert_awaited_once()
+        second.assert_awaited_once()
+
+        # the subscription is kept until its last subscriber unsubscribes
+        await first_view.send_rpc_message('unsubscribe', query)
+        await socket.flush()
+        assert socket._socket.send.await_count == 1
+
+        await socket._dispatch({'id': f'{req_id}#event', 'result': {'data': 2}})
+        assert first.await_count == 1
+        assert second.await_count == 2
+
+        await second_view.send_rpc_message('unsubscribe_all')
+        await socket.flush()
+        sent = json.loads(socket._socket.send.await_args.args[0])
+        assert (sent['method'], sent['params']) == ('unsubscribe', query)
+        assert socket._subscribers == {}
+        await socket.cancel()
+
+    @pytest.mark.asyncio
+    async def test_closing_client_keeps_shared_subscription(self, socket):
+        first, second = mock.AsyncMock(), mock.AsyncMock()
+        first_view, second_view = _RpcConnectionView(socket, first), _RpcConnectionView(socket, second)
+        query = {'query': "tm.event = 'Tx'"}
+
+        await first_view.send_rpc_message('subscribe', query)
+        await second_view.send_rpc_message('subscribe', query)
+        assert await first_view.close() == 1
+        await socket.flush()
+
+        assert socket._socket.send.await_count == 1
+        assert socket._subscribers == {query['query']: [second]}
+        await socket.cancel()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_subscribers_share_request_id(self, socket):
+        first, second = mock.AsyncMock(), mock.AsyncMock()
+
+        async def wait_for_socket():
+            await asyncio.sleep(0)
+            return True
+
+        with mock.patch.object(socket, '_wait_for_socket', side_effect=wait_for_socket):
+            ids = await asyncio.gather(socket.subscribe('q', first), socket.subscribe('q', second))
+        await socket.flush()
+
+        assert socket._socket.send.await_count == 1
+        assert ids[0] is not None and ids[0] == ids[1]
+        assert socket._subscribers == {'q': [first, second]}
+        await socket.cancel()
+
+    @pytest.mark.asyncio
+    async def test_failed_subscribe_removes_own_callbacks(self, socket):
+        first, second, third = mock.AsyncMock(), mock.AsyncMock(), mock.AsyncMock()
+
+        async def not_connected():
+            await asyncio.sleep(0)
+            return False
+
+        socket._subscribers['q'] = [first]
+        with mock.patch.object(socket, '_wait_for_socket', side_effect=not_connected):
+            ids = await asyncio.gather(socket.subscribe('q', second), socket.subscribe('q', third))
+
+        assert ids == [None, None]
+        assert socket._subscribers == {'q': [first]}
+        assert socket._pending_subscriptions == {}
+
+        # the next subscriber sends the request again
+        assert await socket.subscribe('q', second) is not None
+        await socket.cancel()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_resubscribes(self, socket):
+        first, second = mock.AsyncMock(), mock.AsyncMock()
+        old_id = await socket.subscribe('q', first)
+        await socket.send_rpc_message('status', callback=second)
+        await socket.flush()
+
+        new_socket = mock.Mock()
+        new_socket.send = mock.AsyncMock()
+        socket._on_connect(new_socket)
+        await asyncio.sleep(0)
+        await socket.flush()
+
+        sent = json.loads(new_socket.send.await_args.args[0])
+        assert (sent['method'], sent['params']) == ('subscribe', {'query': 'q'})
+        assert socket._routes == {}
+        assert socket._subscription_ids == {sent['id']: 'q'}
+
+        await socket._dispatch({'id': f'{old_id}#event', 'result': {'data': 1}})
+        await socket._dispatch({'id': f"{sent['id']}#event", 'result': {'data': 2}})
+        first.assert_awaited_once_with({'id': f"{sent['id']}#event", 'result': {'data': 2}})
+        await socket.cancel()
+
+
+class TestRpcWebsocketShared:
+
+    @pytest.mark.asyncio
+    async def test_clients_share_connection(self):
+        env = BinanceEnvironment.get_testnet_env()
+
+        def connect(socket):
+            socket._conn = mock.Mock(**{'done.return_value': False})
+
+        with mock.patch.object(ReconnectingRpcWebsocket, '_connect', autospec=True, side_effect=connect):
+            first = await WebsocketRpcClient.create(None, mock.AsyncMock(), env=env)
+            second = await WebsocketRpcClient.create(None, mock.AsyncMock(), env=env)
+
+        conn = first._conn._shared
+        assert second._conn._shared is conn
+
+        await first.close()
+        assert conn in WebsocketRpcClient._SHARED.values()
+        await second.close()
+        assert conn not in WebsocketRpcClient._SHARED.values()
+        conn._conn.cancel.assert_called_once()
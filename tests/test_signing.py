@@ -1,7 +1,19 @@
+import asyncio
+import base64
+import json
+import time
+from decimal import Decimal
+
+import httpx
 import mock
 import pytest
+import requests_mock
+from aiohttp import web, test_utils
 
+from binance_chain.exceptions import BinanceChainAPIException
+from binance_chain.messages import FreezeMsg
 from binance_chain.signing.http import HttpApiSigningClient, AsyncHttpApiSigningClient
+from binance_chain.signing.http2 import Http2ApiSigningClient
 
 
 class TestHttpSigningClient:
@@ -11,6 +23,57 @@ class TestHttpSigningClient:
 
         assert HttpApiSigningClient('https://binance-signing-service.com', 'sam', 'mypass')
 
+    @mock.patch('binance_chain.signing.http.HttpApiSigningClient.authenticate')
+    def test_context_manager(self, _mocker):
+
+        with mock.patch('requests.Session.close') as close:
+            with HttpApiSigningClient('https://binance-signing-service.com', 'sam', 'mypass') as client:
+                adapter = client.session.get_adapter('https://binance-signing-service.com')
+                assert adapter._pool_maxsize == HttpApiSigningClient.MAX_CONNECTIONS
+                assert adapter.max_retries.total == HttpApiSigningClient.MAX_RETRIES
+                assert not adapter.max_retries.is_retry('POST', 503)
+
+        close.assert_called_once()
+
+    def test_request_json(self):
+        endpoint = 'https://binance-signing-service.com'
+        with requests_mock.mock() as m:
+            m.post(f'{endpoint}/api/auth/login', json={'access_token': 'token'})
+            m.post(f'{endpoint}/api/freeze/sign', json={'signed_msg': 'abcd'})
+            client = HttpApiSigningClient(endpoint, 'sam', 'mypass')
+
+            res = client.sign_freeze(FreezeMsg(symbol='BNB', amount=Decimal('10.5')), 'wallet')
+
+            request = m.request_history[-1]
+
+        assert res == {'signed_msg': 'abcd'}
+        assert request.body == b'{"msg":{"amount":10.5,"symbol":"BNB"},"wallet_name":"wallet"}'
+        assert request.headers['Content-Type'] == 'application/json'
+        assert request.headers['Authorization'] == 'Bearer token'
+        assert client._create_uri('freeze/sign') is client._create_uri('freeze/sign')
+
+
+class TestHttp2SigningClient:
+
+    def test_request(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path == '/api/auth/login':
+                return httpx.Response(200, json={'access_token': 'token'})
+            return httpx.Response(200, json={'wallets': []})
+
+        with mock.patch('binance_chain.signing.http.HttpApiSigningClient.authenticate'):
+            client = Http2ApiSigningClient('https://binance-signing-service.com', 'sam', 'mypass')
+        assert isinstance(client.session, httpx.Client)
+
+        client.session = httpx.Client(transport=httpx.MockTransport(handler))
+        client.authenticate()
+
+        assert client.wallet_info() == {'wallets': []}
+        assert requests[1].headers['Authorization'] == 'Bearer token'
+
 
 class TestAsyncHttpSigningClient:
 
@@ -20,3 +83,133 @@ class TestAsyncHttpSigningClient:
 
         assert await AsyncHttpApiSigningClient.create('https://binance-signing-service.com', 'sam', 'mypass')
 
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self):
+
+        async with AsyncHttpApiSigningClient('https://binance-signing-service.com', 'sam', 'mypass') as client:
+            assert client.session.connector.limit == AsyncHttpApiSigningClient.MAX_CONNECTIONS
+
+        assert client.session.closed
+
+    @pytest.mark.asyncio
+    async def test_broadcast_orders(self):
+        client = AsyncHttpApiSigningClient('https://binance-signing-service.com', 'sam', 'mypass')
+        client._post = mock.AsyncMock(side_effect=[{'hash': 'A'}, ValueError('failed')])
+        msgs = [FreezeMsg(symbol=symbol, amount=1) for symbol in ('A', 'B')]
+
+        res = await client.broadcast_orders(msgs, 'wallet')
+
+        assert res[0] == {'hash': 'A'}
+        assert isinstance(res[1], ValueError)
+        client._post.assert_any_await('order/broadcast', data=b'{"msg":{"amount":1,"symbol":"B"},"wallet_name":"wallet"}')
+        await client.close()
+
+
+class TestSigningPayload:
+
+    def test_msg_data_encoded_once(self):
+        msg = FreezeMsg(symbol='BNB', amount=Decimal('2'))
+
+        with mock.patch.object(FreezeMsg, 'to_sign_dict', wraps=msg.to_sign_dict) as to_sign_dict:
+            first = HttpApiSigningClient._get_msg_data(msg, 'wallet')
+            second = HttpApiSigningClient._get_msg_data(msg, 'wallet')
+
+        assert first == second == b'{"msg":{"amount":2.0,"symbol":"BNB"},"wallet_name":"wallet"}'
+        to_sign_dict.assert_called_once()
+
+
+class TestSigningAuthentication:
+
+    endpoint = 'https://binance-signing-service.com'
+
+    @staticmethod
+    def _get_token(exp):
+        payload = base64.urlsafe_b64encode(json.dumps({'sub': 'sam', 'exp': exp}).encode()).rstrip(b'=').decode()
+        return f'header.{payload}.signature'
+
+    def test_token_expiry(self):
+        token = self._get_token(1700000000)
+
+        assert HttpApiSigningClient._get_token_expiry(token) == 1700000000
+        assert HttpApiSigningClient._get_token_expiry('not-a-jwt') is None
+
+    def test_expired_token_refreshed(self):
+        with requests_mock.mock() as m:
+            m.post(f'{self.endpoint}/api/auth/login', [
+                {'json': {'access_token': self._get_token(time.time() - 60)}},
+                {'json': {'access_token': self._get_token(time.time() + 3600)}},
+            ])
+            m.get(f'{self.endpoint}/api/wallet', json={'wallets': []})
+            client = HttpApiSigningClient(self.endpoint, 'sam', 'mypass')
+
+            client.wallet_info()
+            client.wallet_info()
+
+            paths = [request.path for request in m.request_history]
+
+        assert paths == ['/api/auth/login', '/api/auth/login', '/api/wallet', '/api/wallet']
+
+    def test_unauthorised_request_retried(self):
+        with requests_mock.mock() as m:
+            m.post(f'{self.endpoint}/api/auth/login', [
+                {'json': {'access_token': 'first'}}, {'json': {'access_token': 'second'}}
+            ])
+            m.get(f'{self.endpoint}/api/wallet', [
+                {'status_code': 401, 'json': {'message': 'expired'}}, {'json': {'wallets': []}}
+            ])
+            client = HttpApiSigningClient(self.endpoint, 'sam', 'mypass')
+
+            assert client.wallet_info() == {'wallets': []}
+            assert m.request_history[-1].headers['Authorization'] == 'Bearer second'
+
+    def test_old_token_kept_until_replaced(self):
+        with requests_mock.mock() as m:
+            m.post(f'{self.endpoint}/api/auth/login', [
+                {'json': {'access_token': 'first'}}, {'json': {'message': 'unavailable'}, 'status_code': 503}
+            ])
+            client = HttpApiSigningClient(self.endpoint, 'sam', 'mypass')
+
+            with pytest.raises(BinanceChainAPIException):
+                client.authenticate()
+
+            assert 'Authorization' not in m.request_history[-1].headers
+
+        assert client._token == 'first'
+
+    @pytest.fixture
+    async def signing_server(self):
+        logins = []
+        tokens = set()
+
+        async def login(request):
+            logins.append(request.headers.get('Authorization'))
+            await asyncio.sleep(0.01)
+            token = self._get_token(time.time() + 3600 + len(logins))
+            tokens.add(f'Bearer {token}')
+            return web.json_response({'access_token': token})
+
+        async def wallet(request):
+            if request.headers.get('Authorization') not in tokens:
+                return web.json_response({'message': 'expired'}, status=401)
+            return web.json_response({'wallets': []})
+
+        app = web.Application()
+        app.router.add_post('/api/auth/login', login)
+        app.router.add_get('/api/wallet', wallet)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        server.logins = logins
+        yield server
+        await server.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('token', ['expired', 'revoked'])
+    async def test_concurrent_requests_share_login(self, signing_server, token):
+        endpoint = str(signing_server.make_url('')).rstrip('/')
+        async with AsyncHttpApiSigningClient(endpoint, 'sam', 'mypass') as client:
+            client._set_token(self._get_token(time.time() - 60) if token == 'expired' else token)
+
+            res = await asyncio.gather(*[client.wallet_info() for _ in range(3)])
+
+        assert res == [{'wallets': []}] * 3
+        assert signing_server.logins == [None]
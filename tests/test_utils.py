@@ -5,6 +5,7 @@ import pytest
 
 from binance_chain.utils.encode_utils import encode_number, varint_encode
 from binance_chain.utils.segwit_addr import decode_address, address_from_public_key
+from binance_chain.utils import json_utils
 
 
 @pytest.mark.parametrize("num, expected", [
@@ -40,3 +41,46 @@ def test_decode_invalid_address():
 def test_address_from_public_key():
     public_key_hex = b'02cce2ee4e37dc8c65d6445c966faf31ebfe578a90695138947ee7cab8ae9a2c08'
     assert address_from_public_key(public_key_hex) == 'tbnb1csdyysz0xqas7dlq754flfsmey8jwaxwgwaqdx'
+
+
+def test_json_loads_bytes_and_str():
+    assert json_utils.loads(b'{"result": {"height": "1"}}') == {'result': {'height': '1'}}
+    assert json_utils.loads('{"result": null}') == {'result': None}
+
+
+def test_json_loads_invalid():
+    with pytest.raises(ValueError):
+        json_utils.loads(b'<html>')
+
+
+def test_json_dumps():
+    assert json_utils.dumps({'query': "a/b='é'", 'id': 1}) == '{"query":"a/b=\'é\'","id":1}'.encode()
+    assert json_utils._ujson_dumps({'query': "a/b='é'", 'id': 1}) == json_utils.dumps({'query': "a/b='é'", 'id': 1})
+
+
+def test_json_loads_lazy():
+    res = json_utils.loads_lazy(b'{"result": {"block": {"header": {"height": "1"}}}, "error": null}')
+
+    assert 'error' in res and res['error'] is None
+    assert res['result']['block']['header']['height'] == '1'
+
+
+def test_json_loads_lazy_invalid():
+    with pytest.raises(ValueError):
+        json_utils.loads_lazy(b'<html>')
+
+
+def test_json_dumps_decimal():
+    assert json_utils.dumps_decimal({'amount': Decimal('0.5'), 'symbol': 'BNB'}) == b'{"amount":0.5,"symbol":"BNB"}'
+
+    with pytest.raises(TypeError):
+        json_utils.dumps_decimal({'amount': object()})
+
+
+@pytest.mark.parametrize("num", [0, 127, 128, 16383, 16384, 2 ** 63 - 1])
+def test_varint_encode_boundaries(num):
+    encoded = varint_encode(num)
+
+    decoded = sum((b & 0x7f) << (7 * i) for i, b in enumerate(encoded))
+    assert decoded == num
+    assert all(b & 0x80 for b in encoded[:-1]) and not encoded[-1] & 0x80
@@ -1,6 +1,9 @@
+import binascii
+
+import mock
 import pytest
 
-from binance_chain.wallet import Wallet
+from binance_chain.wallet import Wallet, _bip32_master_key, _derive_bip32, _parse_hd_path
 from binance_chain.environment import BinanceEnvironment
 from binance_chain.http import HttpApiClient
 
@@ -26,6 +29,7 @@ class TestWallet:
         assert wallet
         assert wallet.public_key_hex == b'02cce2ee4e37dc8c65d6445c966faf31ebfe578a90695138947ee7cab8ae9a2c08'
         assert wallet.address == 'tbnb10a6kkxlf823w9lwr6l9hzw4uyphcw7qzrud5rr'
+        assert wallet.address_decoded == binascii.unhexlify(b'7f756b1be93aa2e2fdc3d7cb713abc206f877802')
 
     def test_wallet_initialise(self, private_key, env):
 
@@ -101,3 +105,51 @@ class TestWallet:
                     b'\x95N\xe84\xfc\x17\xc0JE\x9a.\xe2\xbb\xa3\x14\xde$\x07\t\xbbB\xeb\xe2\xfb\x1e\xa1dc\x9d\xba'
                     b'\xd2\xfa\xe3\xb6\xc1')
         assert wallet.sign_message(b"testmessage") == expected
+
+    def test_sign_messages_batch(self, private_key, env):
+        wallet = Wallet(private_key=private_key, env=env)
+
+        messages = [b"testmessage", b"othermessage"]
+        assert wallet.sign_messages_batch(messages) == [wallet.sign_message(m) for m in messages]
+
+    def test_wallet_initialise_once(self, private_key, env):
+        wallet = Wallet(private_key=private_key, env=env)
+        wallet._http_client = mock.Mock()
+        wallet._http_client.get_account.return_value = {'account_number': 0, 'sequence': 0}
+        wallet._http_client.get_node_info.return_value = {'node_info': {'network': 'Binance-Chain-Nile'}}
+
+        wallet.initialise_wallet()
+        wallet.initialise_wallet()
+
+        wallet._http_client.get_account.assert_called_once()
+        assert wallet.account_number == 0
+
+    def test_generate_order_id_follows_sequence(self, private_key, env):
+        wallet = Wallet(private_key=private_key, env=env)
+        wallet._sequence = 4
+
+        assert wallet.generate_order_id() == "7F756B1BE93AA2E2FDC3D7CB713ABC206F877802-5"
+
+        wallet.increment_account_sequence()
+
+        assert wallet.generate_order_id() == "7F756B1BE93AA2E2FDC3D7CB713ABC206F877802-6"
+        assert wallet.public_key_hex is wallet.public_key_hex
+
+    def test_create_wallets_from_mnemonic(self, private_key, mnemonic, env):
+        wallets = Wallet.create_wallets_from_mnemonic(mnemonic, children=[0, 1], env=env)
+
+        assert len(wallets) == 2
+        assert wallets[0].private_key == private_key
+        assert wallets[1].private_key == Wallet.create_wallet_from_mnemonic(mnemonic, child=1, env=env).private_key
+        assert wallets[1].private_key != private_key
+
+        with pytest.raises(TypeError):
+            Wallet.create_wallets_from_mnemonic(mnemonic, children=['1'], env=env)
+
+    def test_derive_bip32(self):
+        # BIP32 test vector 1, chain m/0'/1/2'
+        master_key = _bip32_master_key(bytes.fromhex('000102030405060708090a0b0c0d0e0f'))
+
+        key, _ = _derive_bip32(*master_key, _parse_hd_path("0'/1/2'"))
+
+        assert key.hex() == 'cbce0d719ecf7431d88e6a89fa1483e02e35092af60c042b1df2ff59fa424dca'